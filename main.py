@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import sys
 import os
@@ -10,18 +11,88 @@ except ImportError:
     PYGBAG_AVAILABLE = False
 
 from src.flappy import Flappy
+from src.utils import Replay, asset_cache
 
-async def main():
+async def main(seed=None, record=None, dirty_rects=False):
     """Main game entry point with web compatibility"""
-    game = Flappy()
+    game = Flappy(seed=seed, record=record, dirty_rects=dirty_rects)
     await game.start()
 
+def headless(episodes, seed=None):
+    """Run episodes without a display or frame cap and report throughput"""
+    game = Flappy(headless=True, seed=seed)
+    stats = game.simulate(episodes)
+    scores = stats["scores"]
+    print(
+        f"🤖 {stats['episodes']} episodes, {stats['frames']} frames in "
+        f"{stats['seconds']:.2f}s ({stats['fps']:.0f} simulated fps)"
+    )
+    print(f"   best score {max(scores)}, mean score {sum(scores) / len(scores):.1f}")
+    cache = asset_cache.stats()
+    print(
+        f"   asset cache {cache['size']}/{cache['maxsize']}, "
+        f"{cache['hits']} hits, {cache['misses']} misses, "
+        f"{cache['evictions']} evictions"
+    )
+
+def replay(path, runs):
+    """Play a recorded game back as fast as possible, runs times over"""
+    recording = Replay.load(path)
+    game = Flappy(headless=True)
+    for _ in range(runs):
+        stats = game.play_replay(recording)
+        result = "matches" if stats["matches"] else "DIVERGED from"
+        print(
+            f"🔁 score {stats['score']}, {stats['frames']} frames in "
+            f"{stats['seconds'] * 1000:.1f}ms ({stats['fps']:.0f} simulated fps), "
+            f"{result} the recording"
+        )
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Flappy Bird")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="simulate episodes without a window or frame cap",
+    )
+    parser.add_argument(
+        "--episodes",
+        type=int,
+        default=10,
+        help="number of episodes to simulate in headless mode, or times to play a replay",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="seed the session's RNG"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="write a replay of the latest game to FILE",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="play a recorded game back headless, as fast as possible",
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="redraw and present only the parts of the screen that change (always on for web)",
+    )
+    # pygbag passes its own arguments, ignore anything unknown
+    return parser.parse_known_args()[0]
+
 if __name__ == "__main__":
-    if PYGBAG_AVAILABLE:
+    args = parse_args()
+    if args.replay:
+        replay(args.replay, args.episodes)
+    elif args.headless:
+        headless(args.episodes, args.seed)
+    elif PYGBAG_AVAILABLE:
         # Running on web with pygbag
         print("🌐 Running Flappy Bird in web mode")
-        asyncio.run(main())
+        asyncio.run(main(args.seed, args.record, args.dirty_rects))
     else:
         # Running locally
         print("🎮 Running Flappy Bird locally")
-        asyncio.run(main())
+        asyncio.run(main(args.seed, args.record, args.dirty_rects))
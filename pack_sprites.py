@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Sprite Atlas Packer for Flappy Bird
+Packs every sprite into one atlas image plus a JSON index, so the game
+reads and decodes a single file instead of one per sprite.
+Run it again whenever a sprite changes (e.g. after resize_sprites.py).
+"""
+
+import glob
+import json
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame  # noqa: E402
+
+SPRITES_DIR = "assets/sprites"
+ATLAS_IMAGE = os.path.join(SPRITES_DIR, "atlas.png")
+ATLAS_INDEX = os.path.join(SPRITES_DIR, "atlas.json")
+ATLAS_WIDTH = 1024
+PADDING = 1  # transparent pixels between sprites
+
+
+def find_sprites(sprites_dir):
+    """All sprite files to pack, as the paths the game loads them by"""
+    paths = sorted(glob.glob(os.path.join(sprites_dir, "*.png")))
+    return [
+        path.replace(os.sep, "/")
+        for path in paths
+        if os.path.basename(path) != os.path.basename(ATLAS_IMAGE)
+    ]
+
+
+def pack(sizes, width):
+    """Shelf-packs sizes, tallest first, into rows of at most width.
+    Returns the position of each and the atlas height."""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], i))
+    positions = [None] * len(sizes)
+    x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if w > width:
+            raise ValueError(f"sprite {w}px wide doesn't fit a {width}px atlas")
+        if x + w > width:
+            x, y = 0, y + shelf_h + PADDING
+            shelf_h = 0
+        positions[i] = (x, y)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+    return positions, y + shelf_h
+
+
+def main():
+    """Main function to pack all game sprites"""
+    print("Flappy Bird Sprite Atlas Packer")
+    print("=" * 40)
+
+    if not os.path.exists(SPRITES_DIR):
+        print(f"[ERROR] Directory {SPRITES_DIR} not found!")
+        return 1
+
+    # convert_alpha needs a display, and turns colorkeys into alpha the
+    # same way the game does when it loads sprites one by one
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    paths = find_sprites(SPRITES_DIR)
+    images = [pygame.image.load(path).convert_alpha() for path in paths]
+    sizes = [image.get_size() for image in images]
+    positions, height = pack(sizes, ATLAS_WIDTH)
+    # trim the unused width of the widest shelf
+    width = max(x + w for (x, _), (w, _) in zip(positions, sizes))
+
+    atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    sprites = {}
+    for path, image, (x, y), (w, h) in zip(paths, images, positions, sizes):
+        # copy pixels and alpha as they are, without blending
+        atlas.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        sprites[path] = [x, y, w, h]
+        print(f"[OK] {path} {w}x{h} at {x},{y}")
+
+    pygame.image.save(atlas, ATLAS_IMAGE)
+    with open(ATLAS_INDEX, "w") as f:
+        json.dump(
+            {"image": ATLAS_IMAGE, "sprites": sprites}, f, indent=2
+        )
+        f.write("\n")
+
+    print(f"\nSummary: Packed {len(sprites)} sprites into {width}x{height}")
+    print(f"Atlas written to {ATLAS_IMAGE}, index to {ATLAS_INDEX}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
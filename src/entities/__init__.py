@@ -6,11 +6,12 @@ from .enhanced_game_over import EnhancedGameOver
 from .dark_game_over import DarkGameOver
 from .pipe import Pipe, Pipes
 from .player import Player, PlayerMode
-from .score import Score
+from .score import NumberSprite, Score
 from .welcome_message import WelcomeMessage
 from .dark_welcome_message import DarkWelcomeMessage
 from .video_player import VideoPlayer
 from .bird_selection import BirdSelection
+from .widgets import Button, Label, Sprite, Widget
 
 __all__ = [
     "Background",
@@ -19,6 +20,7 @@ __all__ = [
     "Pipes",
     "Player",
     "Score",
+    "NumberSprite",
     "Entity",
     "WelcomeMessage",
     "DarkWelcomeMessage",
@@ -28,4 +30,8 @@ __all__ = [
     "PlayerMode",
     "VideoPlayer",
     "BirdSelection",
+    "Widget",
+    "Label",
+    "Sprite",
+    "Button",
 ]
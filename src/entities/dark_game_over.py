@@ -1,94 +1,88 @@
 import pygame
 from pygame.locals import K_SPACE, K_UP, KEYDOWN, MOUSEBUTTONDOWN
 
-from ..utils import GameConfig, DarkTheme
+from ..utils import GameConfig, DarkTheme, asset_cache, render_text, tag_asset
 from .entity import Entity
+from .score import NumberSprite
 
 
 class DarkGameOver(Entity):
+    """Dark themed game over screen, drawn as two layers: everything that
+    never changes, built once per process, and a small score layer that
+    is recomposed only when the scores shown change."""
+
     def __init__(self, config: GameConfig) -> None:
-        # Create dark-themed game over screen
-        width = config.window.width  
+        width = config.window.width
         height = config.window.height
-        
-        image = DarkTheme.create_dark_surface(width, height, 200)
+        # Central panel for stats and restart info
+        self.panel_rect = pygame.Rect(width//2 - 130, height//2 - 60, 260, 120)
+        # the part of the panel the scores are written on
+        self.score_layer_rect = pygame.Rect(
+            self.panel_rect.x + 2,
+            self.panel_rect.y + 20,
+            self.panel_rect.width - 4,
+            self.panel_rect.height - 22,
+        )
+
+        image = asset_cache.get(
+            ("dark_game_over", width, height),
+            lambda: self.create_dark_game_over(width, height),
+        )
         super().__init__(config, image, 0, 0)
-        
+
         self.config = config
         self.animation_timer = 0
-        self.create_dark_game_over()
-        
-    def create_dark_game_over(self):
-        """Create a modern dark-themed game over screen"""
-        width = self.config.window.width
-        height = self.config.window.height
-        
+        # the best score in digit sprites, recomposed only when it changes
+        self.best_number = NumberSprite(config.images.numbers, height=18)
+        self.scores = None
+        self.score_layer = self.create_score_layer(None, None)
+
+    def create_dark_game_over(self, width, height) -> pygame.Surface:
+        """Create the static layer of the dark-themed game over screen"""
+
         # Clear with dark semi-transparent background
-        self.image.fill((*DarkTheme.BACKGROUND_DARK, 180))
-        
-        # Create fonts
-        try:
-            title_font = pygame.font.Font(None, 56)
-            subtitle_font = pygame.font.Font(None, 28)
-            instruction_font = pygame.font.Font(None, 22)
-        except:
-            title_font = pygame.font.SysFont('Arial', 56, bold=True)
-            subtitle_font = pygame.font.SysFont('Arial', 28)
-            instruction_font = pygame.font.SysFont('Arial', 22)
-        
+        image = DarkTheme.create_dark_surface(width, height, 200)
+        image.fill((*DarkTheme.BACKGROUND_DARK, 180))
+
         # Game Over title with glow effect
         title_text = "GAME OVER"
-        title_surface = title_font.render(title_text, True, DarkTheme.ACCENT_PURPLE)
-        
+        title_surface = render_text(title_text, 56, DarkTheme.ACCENT_PURPLE)
+
         # Create red glow for dramatic effect
         glow_color = (255, 100, 100)
-        glow_surface = title_font.render(title_text, True, glow_color)
+        glow_surface = render_text(title_text, 56, glow_color)
         title_rect = title_surface.get_rect(centerx=width//2, y=100)
-        
-        # Draw glow layers
+
+        # Draw glow layers, all with the same faded copy of the glow text
+        glow_alpha = pygame.Surface(glow_surface.get_size(), pygame.SRCALPHA)
+        glow_alpha.blit(glow_surface, (0, 0))
+        glow_alpha.set_alpha(30)
         for offset in [(3, 3), (-3, -3), (3, -3), (-3, 3), (0, 3), (0, -3), (3, 0), (-3, 0)]:
-            glow_rect = title_rect.move(offset)
-            glow_alpha = pygame.Surface(glow_surface.get_size(), pygame.SRCALPHA)
-            glow_alpha.blit(glow_surface, (0, 0))
-            glow_alpha.set_alpha(30)
-            self.image.blit(glow_alpha, glow_rect)
-        
-        self.image.blit(title_surface, title_rect)
-        
-        # Central panel for stats and restart info
-        panel_rect = pygame.Rect(width//2 - 130, height//2 - 60, 260, 120)
-        DarkTheme.draw_dark_panel(self.image, panel_rect)
-        
-        # Score display placeholder (will be updated by game)
-        score_text = "Final Score: ---"
-        score_surface = subtitle_font.render(score_text, True, DarkTheme.ACCENT_GREEN)
-        score_rect = score_surface.get_rect(centerx=width//2, y=panel_rect.y + 30)
-        self.image.blit(score_surface, score_rect)
-        
-        # Best score placeholder
-        best_text = "Best Score: ---"
-        best_surface = instruction_font.render(best_text, True, DarkTheme.TEXT_SECONDARY)
-        best_rect = best_surface.get_rect(centerx=width//2, y=score_rect.bottom + 15)
-        self.image.blit(best_surface, best_rect)
-        
+            image.blit(glow_alpha, title_rect.move(offset))
+
+        image.blit(title_surface, title_rect)
+
+        DarkTheme.draw_dark_panel(image, self.panel_rect)
+
         # Restart instructions
         restart_text = "SPACE to play again • ESC to quit"
-        restart_surface = instruction_font.render(restart_text, True, DarkTheme.TEXT_PRIMARY)
-        restart_rect = restart_surface.get_rect(centerx=width//2, y=panel_rect.bottom + 20)
-        self.image.blit(restart_surface, restart_rect)
-        
+        restart_surface = render_text(restart_text, 22, DarkTheme.TEXT_PRIMARY)
+        restart_rect = restart_surface.get_rect(centerx=width//2, y=self.panel_rect.bottom + 20)
+        image.blit(restart_surface, restart_rect)
+
         # Add some decorative elements
-        self.add_game_over_decorations()
-    
-    def add_game_over_decorations(self):
+        self.add_game_over_decorations(image)
+        # tagged so its hit mask is cached along with it
+        return tag_asset(image, "dark_game_over", width, height)
+
+    def add_game_over_decorations(self, image: pygame.Surface):
         """Add decorative elements for game over screen"""
-        width = self.config.window.width
-        height = self.config.window.height
-        
+        width, height = image.get_size()
+
         # Corner X marks to indicate game over
         corner_size = 15
         line_width = 3
-        
+
         # Top corners
         for x_pos in [20, width - 35]:
             # Draw X
@@ -96,61 +90,88 @@ class DarkGameOver(Entity):
             end1 = (x_pos + corner_size, 20 + corner_size)
             start2 = (x_pos + corner_size, 20)
             end2 = (x_pos, 20 + corner_size)
-            
-            pygame.draw.line(self.image, DarkTheme.ACCENT_PURPLE, start1, end1, line_width)
-            pygame.draw.line(self.image, DarkTheme.ACCENT_PURPLE, start2, end2, line_width)
-        
+
+            pygame.draw.line(image, DarkTheme.ACCENT_PURPLE, start1, end1, line_width)
+            pygame.draw.line(image, DarkTheme.ACCENT_PURPLE, start2, end2, line_width)
+
         # Bottom accent line
-        pygame.draw.rect(self.image, DarkTheme.ACCENT_PURPLE, (0, height-5, width, 5))
-    
-    def update_score_display(self, current_score, best_score):
-        """Update the score display on the game over screen"""
-        # Recreate the game over screen with updated scores
-        self.create_dark_game_over()
-        
-        width = self.config.window.width
-        
-        try:
-            subtitle_font = pygame.font.Font(None, 28)
-            instruction_font = pygame.font.Font(None, 22)
-        except:
-            subtitle_font = pygame.font.SysFont('Arial', 28)
-            instruction_font = pygame.font.SysFont('Arial', 22)
-        
-        # Update score display
-        panel_rect = pygame.Rect(width//2 - 130, self.config.window.height//2 - 60, 260, 120)
-        
+        pygame.draw.rect(image, DarkTheme.ACCENT_PURPLE, (0, height-5, width, 5))
+
+    def create_score_layer(self, current_score, best_score) -> pygame.Surface:
+        """Draw the scores on a copy of the panel area they sit in, with
+        placeholders until update_score_display sets them"""
+        layer = self.image.subsurface(self.score_layer_rect).copy()
+        # positions below are in screen coordinates, as on the full screen
+        origin = self.score_layer_rect.topleft
+        centerx = self.panel_rect.centerx
+
+        def blit(surface, rect):
+            layer.blit(surface, rect.move(-origin[0], -origin[1]))
+
+        if current_score is None:
+            score_surface = render_text("Final Score: ---", 28, DarkTheme.ACCENT_GREEN)
+            score_rect = score_surface.get_rect(centerx=centerx, y=self.panel_rect.y + 30)
+            blit(score_surface, score_rect)
+
+            best_surface = render_text("Best Score: ---", 22, DarkTheme.TEXT_SECONDARY)
+            best_rect = best_surface.get_rect(centerx=centerx, y=score_rect.bottom + 15)
+            blit(best_surface, best_rect)
+            return layer
+
         # Clear the score area and redraw with actual scores
+        panel_rect = self.panel_rect
         score_area = pygame.Rect(panel_rect.x + 10, panel_rect.y + 20, panel_rect.width - 20, 60)
-        pygame.draw.rect(self.image, DarkTheme.BACKGROUND_MEDIUM, score_area)
-        
+        pygame.draw.rect(layer, DarkTheme.BACKGROUND_MEDIUM, score_area.move(-origin[0], -origin[1]))
+
         # Current score
-        score_text = f"Final Score: {current_score}"
-        score_surface = subtitle_font.render(score_text, True, DarkTheme.ACCENT_GREEN)
-        score_rect = score_surface.get_rect(centerx=width//2, y=panel_rect.y + 30)
-        self.image.blit(score_surface, score_rect)
-        
-        # Best score
-        best_text = f"Best Score: {best_score}"
+        score_surface = render_text(f"Final Score: {current_score}", 28, DarkTheme.ACCENT_GREEN)
+        score_rect = score_surface.get_rect(centerx=centerx, y=panel_rect.y + 30)
+        blit(score_surface, score_rect)
+
+        # Best score, label in text and value in digit sprites
         best_color = DarkTheme.ACCENT_BLUE if current_score >= best_score else DarkTheme.TEXT_SECONDARY
-        best_surface = instruction_font.render(best_text, True, best_color)
-        best_rect = best_surface.get_rect(centerx=width//2, y=score_rect.bottom + 15)
-        self.image.blit(best_surface, best_rect)
-        
+        best_surface = render_text("Best Score:", 22, best_color)
+        self.best_number.set(best_score)
+        best_digits = self.best_number.surface
+        gap = 6
+        best_rect = pygame.Rect(
+            0,
+            score_rect.bottom + 15,
+            best_surface.get_width() + gap + best_digits.get_width(),
+            max(best_surface.get_height(), best_digits.get_height()),
+        )
+        best_rect.centerx = centerx
+        blit(
+            best_surface, best_surface.get_rect(x=best_rect.x, centery=best_rect.centery)
+        )
+        blit(
+            best_digits, best_digits.get_rect(right=best_rect.right, centery=best_rect.centery)
+        )
+
         # New record indicator
         if current_score >= best_score and best_score > 0:
-            record_text = "🏆 NEW RECORD!"
-            record_surface = instruction_font.render(record_text, True, DarkTheme.ACCENT_GREEN)
-            record_rect = record_surface.get_rect(centerx=width//2, y=best_rect.bottom + 10)
-            self.image.blit(record_surface, record_rect)
-    
-    def tick(self):
+            record_surface = render_text("🏆 NEW RECORD!", 22, DarkTheme.ACCENT_GREEN)
+            record_rect = record_surface.get_rect(centerx=centerx, y=best_rect.bottom + 10)
+            blit(record_surface, record_rect)
+        return layer
+
+    def update_score_display(self, current_score, best_score):
+        """Update the score display on the game over screen"""
+        if (current_score, best_score) == self.scores:
+            return
+        self.scores = (current_score, best_score)
+        self.score_layer = self.create_score_layer(current_score, best_score)
+
+    def draw(self) -> None:
+        self.config.screen.blit(self.image, self.draw_rect)
+        self.config.screen.blit(self.score_layer, self.score_layer_rect)
+
+    def update(self):
         """Update the game over screen with subtle animations"""
+        super().update()
         self.animation_timer += self.config.clock.get_time()
-        
+
         # Add subtle pulsing effect every 2 seconds
         if self.animation_timer >= 2000:
             self.animation_timer = 0
             # Could add subtle animation effects here
-        
-        super().tick()
\ No newline at end of file
@@ -131,15 +131,15 @@ class DarkWelcomeMessage(Entity):
         """Update pulsing animations"""
         self.pulse_timer += self.config.clock.get_time()
         
-        # Recreate the welcome screen with updated animation
-        if self.pulse_timer >= 100:  # Update every 100ms
-            self.create_dark_welcome()
+        # Nothing on the screen pulses yet; it's built once in __init__
+        # rather than rebuilt every 100ms to the same image
+        if self.pulse_timer >= 100:
             self.pulse_timer = 0
     
-    def tick(self):
+    def update(self):
         """Update the welcome message"""
+        super().update()
         self.update_animation()
-        super().tick()
     
     def handle_input(self, event):
         """Handle input events"""
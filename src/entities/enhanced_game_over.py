@@ -1,5 +1,5 @@
 import pygame
-from ..utils import GameConfig
+from ..utils import GameConfig, render_text
 from .entity import Entity
 
 
@@ -12,19 +12,17 @@ class EnhancedGameOver(Entity):
             y=int(config.window.height * 0.2),
         )
         
-        # Create text surfaces for the try again message
-        self.font_large = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
-        
-        # Create "Try Again?" text
-        self.try_again_text = self.font_large.render("Try Again?", True, (255, 255, 255))
+        # Text surfaces for the try again message, rendered once per process
+        self.try_again_text = render_text("Try Again?", 36, (255, 255, 255))
         self.try_again_rect = self.try_again_text.get_rect(
             centerx=config.window.width // 2,
             y=self.y + self.image.get_height() + 30
         )
         
         # Create instruction text
-        self.instruction_text = self.font_small.render("Press SPACE or tap to restart", True, (200, 200, 200))
+        self.instruction_text = render_text(
+            "Press SPACE or tap to restart", 24, (200, 200, 200)
+        )
         self.instruction_rect = self.instruction_text.get_rect(
             centerx=config.window.width // 2,
             y=self.try_again_rect.bottom + 15
@@ -32,17 +30,26 @@ class EnhancedGameOver(Entity):
         
         # Animation variables
         self.blink_timer = 0
+        self.blink_steps = config.step_fps // 2  # toggle every half second
         self.show_try_again = True
         
-    def tick(self) -> None:
-        super().tick()
+    def update(self) -> None:
+        super().update()
         
         # Animate the "Try Again?" text with blinking effect
         self.blink_timer += 1
-        if self.blink_timer >= 30:  # Blink every 30 frames (about 0.5 seconds at 60 FPS)
+        if self.blink_timer >= self.blink_steps:
             self.show_try_again = not self.show_try_again
             self.blink_timer = 0
         
+    @property
+    def dirty_rect(self) -> pygame.Rect:
+        # the blinking text's rect is included even while hidden
+        return self.image.get_rect(topleft=(self.x, self.y)).unionall(
+            [self.try_again_rect, self.instruction_rect]
+        )
+
+    def draw(self) -> None:
         # Draw the game over image
         self.config.screen.blit(self.image, (self.x, self.y))
         
@@ -1,8 +1,8 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 import pygame
 
-from ..utils import GameConfig, get_hit_mask, pixel_collision
+from ..utils import GameConfig, get_hit_mask, pixel_collision, scaled
 
 
 class Entity:
@@ -19,10 +19,13 @@ class Entity:
         self.config = config
         self.x = x
         self.y = y
+        # position before the last update, for interpolated drawing
+        self.prev_x = x
+        self.prev_y = y
         if w or h:
             self.w = w or config.window.ratio * h
             self.h = h or w / config.window.ratio
-            self.image = pygame.transform.scale(image, (self.w, self.h))
+            self.image = scaled(image, (self.w, self.h))
         else:
             self.image = image
             self.w = image.get_width() if image else 0
@@ -51,6 +54,24 @@ class Entity:
     def rect(self) -> pygame.Rect:
         return pygame.Rect(self.x, self.y, self.w, self.h)
 
+    @property
+    def draw_pos(self) -> Tuple[float, float]:
+        """position interpolated between the last two simulation steps"""
+        alpha = self.config.timestep.alpha
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+        )
+
+    @property
+    def draw_rect(self) -> pygame.Rect:
+        return pygame.Rect(*self.draw_pos, self.w, self.h)
+
+    @property
+    def dirty_rect(self) -> pygame.Rect:
+        """the screen area draw() paints over"""
+        return self.draw_rect
+
     def collide(self, other) -> bool:
         if not self.hit_mask or not other.hit_mask:
             return self.rect.colliderect(other.rect)
@@ -59,25 +80,27 @@ class Entity:
         )
 
     def tick(self) -> None:
+        """one simulation step followed by drawing it"""
+        self.update()
+        self.render()
+
+    def update(self) -> None:
+        """advances the entity's state by one simulation step, without
+        drawing. subclasses call this first to remember where they were."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def render(self) -> None:
+        """draws the current state and queues its debug info; never
+        changes state so it can be skipped or repeated freely"""
         self.draw()
-        rect = self.rect
-        if self.config.debug:
-            pygame.draw.rect(self.config.screen, (255, 0, 0), rect, 1)
-            # write x and y at top of rect
-            font = pygame.font.SysFont("Arial", 13, True)
-            text = font.render(
-                f"{self.x:.1f}, {self.y:.1f}, {self.w:.1f}, {self.h:.1f}",
-                True,
-                (255, 255, 255),
-            )
-            self.config.screen.blit(
-                text,
-                (
-                    rect.x + rect.w / 2 - text.get_width() / 2,
-                    rect.y - text.get_height(),
-                ),
+        if self.config.dirty_rects is not None:
+            self.config.dirty_rects.add(self.dirty_rect)
+        if self.config.debug_overlay is not None:
+            self.config.debug_overlay.add(
+                self.draw_rect, self.x, self.y, self.w, self.h
             )
 
     def draw(self) -> None:
         if self.image:
-            self.config.screen.blit(self.image, self.rect)
+            self.config.screen.blit(self.image, self.draw_rect)
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 from ..utils import GameConfig
 from .entity import Entity
 
@@ -6,11 +8,20 @@ class Floor(Entity):
     def __init__(self, config: GameConfig) -> None:
         super().__init__(config, config.images.base, 0, config.window.vh)
         self.vel_x = 4
+        self.scroll = 0  # distance scrolled by the latest update
         self.x_extra = self.w - config.window.w
 
     def stop(self) -> None:
         self.vel_x = 0
 
-    def draw(self) -> None:
-        self.x = -((-self.x + self.vel_x) % self.x_extra)
-        super().draw()
+    def update(self) -> None:
+        super().update()
+        self.scroll = self.vel_x
+        self.x = -((-self.x + self.scroll) % self.x_extra)
+
+    @property
+    def draw_pos(self) -> Tuple[float, float]:
+        # interpolate the scroll before wrapping, not across the wrap. use
+        # the scroll of the latest update, vel_x may have changed since
+        scroll = self.scroll * self.config.timestep.alpha
+        return -((-self.prev_x + scroll) % self.x_extra), self.y
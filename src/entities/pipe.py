@@ -1,5 +1,4 @@
-import random
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
 from ..utils import GameConfig
 from .entity import Entity
@@ -10,12 +9,18 @@ class Pipe(Entity):
         super().__init__(*args, **kwargs)
         self.vel_x = -5
 
-    def draw(self) -> None:
+    def update(self) -> None:
+        super().update()
         self.x += self.vel_x
-        super().draw()
 
 
 class Pipes(Entity):
+    """Pairs of pipes, kept in spawn order in upper and lower.
+
+    All pipes move at the same speed, so spawn order is also x order and
+    the pairs near any x can be found from the front of the lists.
+    """
+
     upper: List[Pipe]
     lower: List[Pipe]
 
@@ -26,16 +31,42 @@ class Pipes(Entity):
         self.bottom = self.config.window.viewport_height
         self.upper = []
         self.lower = []
+        # index of the first upper pipe not yet crossed, see next_pipe
+        self.cursor = 0
         self.spawn_initial_pipes()
 
-    def tick(self) -> None:
+    def update(self) -> None:
         if self.can_spawn_pipes():
             self.spawn_new_pipes()
         self.remove_old_pipes()
 
         for up_pipe, low_pipe in zip(self.upper, self.lower):
-            up_pipe.tick()
-            low_pipe.tick()
+            up_pipe.update()
+            low_pipe.update()
+
+    def render(self) -> None:
+        for up_pipe, low_pipe in zip(self.upper, self.lower):
+            up_pipe.render()
+            low_pipe.render()
+
+    def near(self, x0: float, x1: float) -> Iterator[Tuple[Pipe, Pipe]]:
+        """pipe pairs whose x span overlaps x0..x1"""
+        for up_pipe, low_pipe in zip(self.upper, self.lower):
+            if up_pipe.x >= x1:
+                break
+            if up_pipe.x + up_pipe.w > x0:
+                yield up_pipe, low_pipe
+
+    def next_pipe(self, x: float) -> Optional[Pipe]:
+        """the upper pipe whose center crosses x next, or is crossing it
+        this step (see Player.crossed). the cursor moves on once a pipe's
+        crossing window is behind x, instead of polling every pipe."""
+        while self.cursor < len(self.upper):
+            pipe = self.upper[self.cursor]
+            if pipe.cx - pipe.vel_x > x:
+                return pipe
+            self.cursor += 1
+        return None
 
     def stop(self) -> None:
         for pipe in self.upper + self.lower:
@@ -56,13 +87,12 @@ class Pipes(Entity):
 
     def remove_old_pipes(self):
         # remove first pipe if its out of the screen
-        for pipe in self.upper:
-            if pipe.x < -pipe.w:
-                self.upper.remove(pipe)
+        while self.upper and self.upper[0].x < -self.upper[0].w:
+            self.upper.pop(0)
+            self.cursor = max(self.cursor - 1, 0)
 
-        for pipe in self.lower:
-            if pipe.x < -pipe.w:
-                self.lower.remove(pipe)
+        while self.lower and self.lower[0].x < -self.lower[0].w:
+            self.lower.pop(0)
 
     def spawn_initial_pipes(self):
         upper_1, lower_1 = self.make_random_pipes()
@@ -82,7 +112,9 @@ class Pipes(Entity):
         # y of gap between upper and lower pipe
         base_y = self.config.window.viewport_height
 
-        gap_y = random.randrange(0, int(base_y * 0.6 - self.pipe_gap))
+        gap_y = self.config.random.randrange(
+            0, int(base_y * 0.6 - self.pipe_gap)
+        )
         gap_y += int(base_y * 0.2)
         pipe_height = self.config.images.pipe[0].get_height()
         pipe_x = self.config.window.width + 10
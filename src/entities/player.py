@@ -1,9 +1,16 @@
 from enum import Enum
 from itertools import cycle
+from typing import Tuple
 
 import pygame
 
-from ..utils import GameConfig, clamp
+from ..utils import (
+    GameConfig,
+    HitMaskType,
+    clamp,
+    get_rotation_atlas,
+    pixel_collision,
+)
 from .entity import Entity
 from .floor import Floor
 from .pipe import Pipe, Pipes
@@ -28,6 +35,11 @@ class Player(Entity):
         self.frame = 0
         self.crashed = False
         self.crash_entity = None
+        # each flap frame and its hit mask at every angle the bird is
+        # drawn at
+        self.rotations = [
+            get_rotation_atlas(image) for image in config.images.player
+        ]
         self.set_mode(PlayerMode.SHM)
 
     def set_mode(self, mode: PlayerMode) -> None:
@@ -116,7 +128,8 @@ class Player(Entity):
     def rotate(self) -> None:
         self.rot = clamp(self.rot + self.vel_rot, self.rot_min, self.rot_max)
 
-    def draw(self) -> None:
+    def update(self) -> None:
+        super().update()
         self.update_image()
         if self.mode == PlayerMode.SHM:
             self.tick_shm()
@@ -125,12 +138,21 @@ class Player(Entity):
         elif self.mode == PlayerMode.CRASH:
             self.tick_crash()
 
+    @property
+    def dirty_rect(self) -> pygame.Rect:
+        rotated_image, pos = self.rotations[self.img_idx].get_image(
+            self.rot, self.draw_rect
+        )
+        return rotated_image.get_rect(topleft=pos)
+
+    def draw(self) -> None:
         self.draw_player()
 
     def draw_player(self) -> None:
-        rotated_image = pygame.transform.rotate(self.image, self.rot)
-        rotated_rect = rotated_image.get_rect(center=self.rect.center)
-        self.config.screen.blit(rotated_image, rotated_rect)
+        rotated_image, pos = self.rotations[self.img_idx].get_image(
+            self.rot, self.draw_rect
+        )
+        self.config.screen.blit(rotated_image, pos)
 
     def stop_wings(self) -> None:
         self.img_gen = cycle([self.img_idx])
@@ -142,6 +164,16 @@ class Player(Entity):
             self.rot = 80
             self.config.sounds.wing.play()
 
+    def rotated_hit_mask(self) -> Tuple[pygame.Rect, HitMaskType]:
+        """rect and hit mask of the bird as drawn, rotated by rot"""
+        return self.rotations[self.img_idx].get(self.rot, self.rect)
+
+    def collide(self, other) -> bool:
+        rect, hit_mask = self.rotated_hit_mask()
+        if not other.hit_mask:
+            return rect.colliderect(other.rect)
+        return pixel_collision(rect, other.rect, hit_mask, other.hit_mask)
+
     def crossed(self, pipe: Pipe) -> bool:
         return pipe.cx <= self.cx < pipe.cx - pipe.vel_x
 
@@ -154,13 +186,10 @@ class Player(Entity):
             self.crash_entity = "floor"
             return True
 
-        for pipe in pipes.upper:
-            if self.collide(pipe):
-                self.crashed = True
-                self.crash_entity = "pipe"
-                return True
-        for pipe in pipes.lower:
-            if self.collide(pipe):
+        # only the pipes around the bird's x span can touch it
+        rect, _ = self.rotated_hit_mask()
+        for up_pipe, low_pipe in pipes.near(rect.left, rect.right):
+            if self.collide(up_pipe) or self.collide(low_pipe):
                 self.crashed = True
                 self.crash_entity = "pipe"
                 return True
@@ -1,38 +1,85 @@
+from typing import List, Optional
+
 import pygame
 
 from ..utils import GameConfig
 from .entity import Entity
 
 
+class NumberSprite:
+    """A number drawn with the digit sprites, composed into one surface
+    the first time it's needed after set() changes it, so drawing it is a
+    single blit. With height, the composed surface is scaled to it."""
+
+    def __init__(
+        self, numbers: List[pygame.Surface], height: Optional[int] = None
+    ) -> None:
+        self.numbers = numbers
+        self.height = height
+        self.value = 0
+        self._surface: Optional[pygame.Surface] = None
+
+    def set(self, value: int) -> None:
+        if value != self.value:
+            self.value = value
+            self._surface = None
+
+    @property
+    def surface(self) -> pygame.Surface:
+        if self._surface is None:
+            self._surface = self.compose()
+        return self._surface
+
+    def compose(self) -> pygame.Surface:
+        images = [self.numbers[int(digit)] for digit in str(self.value)]
+        w = sum(image.get_width() for image in images)
+        h = max(image.get_height() for image in images)
+        surface = pygame.Surface((w, h), pygame.SRCALPHA)
+        x = 0
+        for image in images:
+            surface.blit(image, (x, 0))
+            x += image.get_width()
+        if self.height and self.height != h:
+            surface = pygame.transform.smoothscale(
+                surface, (round(w * self.height / h), self.height)
+            )
+        return surface
+
+
 class Score(Entity):
     def __init__(self, config: GameConfig) -> None:
         super().__init__(config)
         self.y = self.config.window.height * 0.1
         self.score = 0
+        self.number = NumberSprite(config.images.numbers)
+        self._rect: Optional[pygame.Rect] = None
 
     def reset(self) -> None:
         self.score = 0
+        self.invalidate()
 
     def add(self) -> None:
         self.score += 1
+        self.invalidate()
         self.config.sounds.point.play()
 
+    def invalidate(self) -> None:
+        self.number.set(self.score)
+        self._rect = None
+
     @property
     def rect(self) -> pygame.Rect:
-        score_digits = [int(x) for x in list(str(self.score))]
-        images = [self.config.images.numbers[digit] for digit in score_digits]
-        w = sum(image.get_width() for image in images)
-        x = (self.config.window.width - w) / 2
-        h = max(image.get_height() for image in images)
-        return pygame.Rect(x, self.y, w, h)
+        if self._rect is None:
+            w, h = self.number.surface.get_size()
+            x = (self.config.window.width - w) / 2
+            self._rect = pygame.Rect(x, self.y, w, h)
+        return self._rect
+
+    @property
+    def draw_rect(self) -> pygame.Rect:
+        # the score never moves, it's drawn where its digits are
+        return self.rect
 
     def draw(self) -> None:
         """displays score in center of screen"""
-        score_digits = [int(x) for x in list(str(self.score))]
-        images = [self.config.images.numbers[digit] for digit in score_digits]
-        digits_width = sum(image.get_width() for image in images)
-        x_offset = (self.config.window.width - digits_width) / 2
-
-        for image in images:
-            self.config.screen.blit(image, (x_offset, self.y))
-            x_offset += image.get_width()
+        self.config.screen.blit(self.number.surface, self.rect)
@@ -1,5 +1,7 @@
 import pygame
 import os
+import queue
+import threading
 from pygame.locals import K_SPACE, K_ESCAPE, KEYDOWN
 
 # Try to import OpenCV, fall back to placeholder if not available (web compatibility)
@@ -12,9 +14,31 @@ except ImportError:
 
 from ..utils import GameConfig, DarkTheme
 from .entity import Entity
+from .widgets import Label
+
+
+# put in the frame buffer by the decoder after the last frame
+END_OF_VIDEO = object()
 
 
 class VideoPlayer(Entity):
+    """Plays a video with OpenCV, or shows a placeholder without it.
+
+    While playing, a decoder thread reads, converts and scales frames
+    into a bounded buffer, and blocks while it is full; the game loop
+    only takes the next ready frame and blits it, so a slow decode never
+    stalls input or rendering. The thread owns the capture while it
+    runs, and stop() and cleanup() end it before anything else uses it.
+
+    Playback follows the wall clock rather than the game's tick rate:
+    the frame due at any moment is the elapsed play time times the
+    video's fps. The game loop shows the latest frame that is due and
+    drops older ones, and a decoder that falls behind skips the frames
+    already late with cap.grab(), which doesn't decode them.
+    """
+
+    BUFFER_FRAMES = 8  # decoded frames kept ready ahead of playback
+
     def __init__(self, config: GameConfig, video_path: str) -> None:
         # Create a placeholder surface initially
         image = pygame.Surface((1, 1))
@@ -24,12 +48,35 @@ class VideoPlayer(Entity):
         self.cap = None
         self.fps = 30
         self.frame_duration = 1000 / self.fps  # milliseconds per frame
-        self.last_frame_time = 0
+        self.duration = None  # milliseconds, None if the video doesn't say
+        # play time is now - started_at, less time spent stopped
+        self.started_at = None
+        self.stopped_at = None
+        self.pending = None  # (index, surface) taken early, not yet due
         self.current_frame = None
         self.video_ended = False
         self.video_loaded = False
         self.is_playing = False
         self.web_mode = not CV2_AVAILABLE
+        self.frames = queue.Queue(self.BUFFER_FRAMES)
+        self.decoder = None
+        self.stop_decoding = threading.Event()
+        # frame arrays and the surfaces over them, see create_frame_pool
+        self.pool = None
+        self.pool_surfaces = None
+        # next pool slot to write, kept across decoder threads so one
+        # started by play() after stop() doesn't overwrite buffered frames
+        self.pool_slot = 0
+        # skip instruction on a black box in the bottom right corner, 10px
+        # from the edges (the box's padding reaches 5px and 7px past that)
+        self.skip_label = Label(
+            "Press SPACE to skip",
+            24,
+            (255, 255, 255),
+            background=(0, 0, 0),
+            padding=(10, 5),
+            bottomright=(config.window.width - 5, config.window.height - 7),
+        )
         
         # Try to load the video
         self.load_video()
@@ -55,6 +102,9 @@ class VideoPlayer(Entity):
             # Get video properties
             self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30
             self.frame_duration = 1000 / self.fps
+            frame_count = self.cap.get(cv2.CAP_PROP_FRAME_COUNT)
+            if frame_count > 0:
+                self.duration = frame_count * self.frame_duration
             
             print(f"Video loaded successfully: {self.video_path}")
             print(f"FPS: {self.fps}")
@@ -160,70 +210,165 @@ class VideoPlayer(Entity):
         self.current_frame.blit(info, info_rect)
         self.current_frame.blit(skip, skip_rect)
     
+    def play_time(self):
+        """Milliseconds of playback so far, not counting time stopped"""
+        if self.started_at is None:
+            return 0
+        if self.stopped_at is not None:
+            return self.stopped_at - self.started_at
+        return pygame.time.get_ticks() - self.started_at
+
+    def due_frame(self):
+        """Index of the source frame that should be on screen now"""
+        return int(self.play_time() / self.frame_duration)
+
     def get_next_frame(self):
-        """Get the next frame from the video"""
-        if not self.video_loaded or not self.cap:
-            return None
-            
-        ret, frame = self.cap.read()
-        if not ret:
-            self.video_ended = True
+        """Take the latest decoded frame that is due, without waiting,
+        dropping any older ones. Returns None when no new frame is due or
+        ready yet, or the video has ended."""
+        if not self.video_loaded:
             return None
-            
-        # Convert BGR to RGB (OpenCV uses BGR, pygame uses RGB)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Convert to pygame surface
-        frame = np.rot90(frame)  # Rotate for pygame
-        frame = np.flipud(frame)  # Flip for pygame
-        surface = pygame.surfarray.make_surface(frame)
-        
+        due = self.due_frame()
+        frame = None
+        while True:
+            if self.pending is None:
+                try:
+                    self.pending = self.frames.get_nowait()
+                except queue.Empty:
+                    break  # decoder is behind, keep what we have
+            if self.pending is END_OF_VIDEO:
+                self.video_ended = True
+                break
+            index, surface = self.pending
+            if index > due:
+                break  # decoded ahead, keep it until it's due
+            frame = surface
+            self.pending = None
+        return frame
+
+    def decode_frames(self):
+        """Decoder thread: fills the frame buffer until the video ends or
+        stop_decoding is set"""
+        frame = None
+        index = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES))
+        while not self.stop_decoding.is_set():
+            # skip frames whose time has already passed without decoding
+            ret = True
+            due = self.due_frame()
+            while ret and index < due:
+                ret = self.cap.grab()
+                index += 1
+            if ret:
+                # read into the previous frame's array instead of a new one
+                ret, frame = self.cap.read(frame)
+            if ret:
+                if self.pool is None:
+                    self.create_frame_pool(frame.shape[1], frame.shape[0])
+                self.convert_frame(frame, self.pool[self.pool_slot])
+                item = (index, self.pool_surfaces[self.pool_slot])
+                index += 1
+            else:
+                item = END_OF_VIDEO
+            # wait while the buffer is full, but keep checking for stop
+            while not self.stop_decoding.is_set():
+                try:
+                    self.frames.put(item, timeout=0.05)
+                    if ret:
+                        # only a queued frame takes its slot
+                        self.pool_slot = (self.pool_slot + 1) % len(self.pool)
+                    break
+                except queue.Full:
+                    pass
+            if not ret:
+                return
+
+    def create_frame_pool(self, frame_width, frame_height):
+        """Allocate every array frames are converted through, once.
+
+        Each pool array backs a surface made with image.frombuffer, so a
+        frame converted into it is ready to blit without any copy. The
+        pool has room for a full buffer, the frame on screen, one taken
+        from the buffer before it's due and the one being decoded, so the
+        decoder never writes over a frame still in use.
+        """
         # Scale to fit screen while maintaining aspect ratio
         screen_width = self.config.window.width
         screen_height = self.config.window.height
-        
-        # Get original frame dimensions
-        frame_width, frame_height = surface.get_size()
-        
-        # Calculate scaling to fit screen
         scale_x = screen_width / frame_width
         scale_y = screen_height / frame_height
         scale = min(scale_x, scale_y) * 0.8  # 80% of screen size
-        
-        new_width = int(frame_width * scale)
-        new_height = int(frame_height * scale)
-        
-        scaled_surface = pygame.transform.scale(surface, (new_width, new_height))
-        return scaled_surface
+
+        self.frame_size = (int(frame_width * scale), int(frame_height * scale))
+        width, height = self.frame_size
+        self.resized = np.empty((height, width, 3), np.uint8)
+        self.pool = [
+            np.empty((height, width, 3), np.uint8)
+            for _ in range(self.BUFFER_FRAMES + 3)
+        ]
+        self.pool_surfaces = [
+            pygame.image.frombuffer(array, self.frame_size, "RGB")
+            for array in self.pool
+        ]
+
+    def convert_frame(self, frame, out):
+        """Scale a BGR frame from OpenCV to the screen size and write it
+        into out as RGB. OpenCV writes straight into the preallocated
+        arrays, and the rows stay contiguous the way pygame reads them,
+        so no rotating or flipping is needed."""
+        # nearest neighbor, as pygame.transform.scale did before
+        cv2.resize(
+            frame, self.frame_size, dst=self.resized, interpolation=cv2.INTER_NEAREST
+        )
+        # Convert BGR to RGB (OpenCV uses BGR, pygame uses RGB)
+        cv2.cvtColor(self.resized, cv2.COLOR_BGR2RGB, dst=out)
     
     def play(self):
         """Start video playback"""
         self.is_playing = True
+        now = pygame.time.get_ticks()
+        if self.started_at is None:
+            self.started_at = now
+        elif self.stopped_at is not None:
+            # resume where playback stopped
+            self.started_at += now - self.stopped_at
+        self.stopped_at = None
         if not self.video_loaded:
             self.create_placeholder()
+        elif self.decoder is None and not self.video_ended:
+            self.stop_decoding.clear()
+            self.decoder = threading.Thread(
+                target=self.decode_frames, name="video-decoder", daemon=True
+            )
+            self.decoder.start()
     
     def stop(self):
-        """Stop video playback"""
+        """Stop video playback and the decoder thread"""
+        if self.is_playing:
+            self.stopped_at = pygame.time.get_ticks()
         self.is_playing = False
+        if self.decoder is not None:
+            self.stop_decoding.set()
+            self.decoder.join()
+            self.decoder = None
     
     def update_animation(self):
-        """Update video frame based on timing"""
+        """Show the frame due at the current play time"""
         if not self.is_playing:
             return
             
         if self.video_loaded and not self.video_ended:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.last_frame_time >= self.frame_duration:
-                self.current_frame = self.get_next_frame()
-                self.last_frame_time = current_time
+            frame = self.get_next_frame()
+            if frame is not None:
+                self.current_frame = frame
     
-    def tick(self):
+    def update(self):
         """Update the video player"""
+        super().update()
         self.update_animation()
-        super().tick()
     
-    def draw(self, screen):
+    def draw(self, screen=None):
         """Draw the current video frame"""
+        screen = screen or self.config.screen
         if self.current_frame:
             # Center the video on screen
             screen_rect = screen.get_rect()
@@ -233,15 +378,7 @@ class VideoPlayer(Entity):
             screen.blit(self.current_frame, video_rect)
             
         # Draw skip instruction
-        font = pygame.font.Font(None, 24)
-        skip_text = font.render("Press SPACE to skip", True, (255, 255, 255))
-        text_rect = skip_text.get_rect()
-        text_rect.bottomright = (screen.get_width() - 10, screen.get_height() - 10)
-        
-        # Draw background for text
-        bg_rect = text_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect)
-        screen.blit(skip_text, text_rect)
+        self.skip_label.draw(screen)
     
     def handle_input(self, event):
         """Handle input events during video playback"""
@@ -251,11 +388,18 @@ class VideoPlayer(Entity):
         return None
     
     def is_finished(self):
-        """Check if video has ended"""
-        return self.video_ended or not self.video_loaded
+        """Check if the video's running time has passed, or it ended
+        early (or has no known length) and there are no frames left"""
+        if self.video_ended or not self.video_loaded:
+            return True
+        return self.duration is not None and self.play_time() >= self.duration
     
     def cleanup(self):
         """Clean up video resources"""
+        self.stop()
+        # drop buffered frames, the thread is gone so nothing refills it
+        self.frames = queue.Queue(self.BUFFER_FRAMES)
+        self.pending = None
         if self.cap:
             self.cap.release()
             self.cap = None
\ No newline at end of file
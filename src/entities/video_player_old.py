@@ -142,11 +142,11 @@ class VideoPlayer(Entity):
         if self.animation_frame % 5 == 0:
             self.create_animated_placeholder()
     
-    def tick(self) -> None:
+    def update(self) -> None:
         """Update the video player."""
+        super().update()
         if self.is_playing:
             self.update_animation()
-        super().tick()
 
 
 def create_default_video_placeholder(config: GameConfig) -> None:
@@ -0,0 +1,139 @@
+from typing import Optional, Tuple
+
+import pygame
+
+from ..utils import render_text, scaled
+
+
+class Widget:
+    """A piece of UI drawn from a surface that is rendered once and kept
+    until what it shows changes, so drawing it is one blit.
+
+    Subclasses implement render() and call invalidate() when their
+    content or state changes. The widget is placed by anchor keywords,
+    as for Surface.get_rect, e.g. center=(x, y) or bottomright=(x, y).
+    """
+
+    def __init__(self, **anchor) -> None:
+        self.anchor = anchor
+        self._surface: Optional[pygame.Surface] = None
+        self._rect: Optional[pygame.Rect] = None
+
+    def render(self) -> pygame.Surface:
+        raise NotImplementedError
+
+    def invalidate(self) -> None:
+        self._surface = None
+
+    @property
+    def surface(self) -> pygame.Surface:
+        if self._surface is None:
+            self._surface = self.render()
+            self._rect = self._surface.get_rect(**self.anchor)
+        return self._surface
+
+    @property
+    def rect(self) -> pygame.Rect:
+        self.surface
+        return self._rect
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        return screen.blit(self.surface, self.rect)
+
+
+class Label(Widget):
+    """Text in pygame's default font, optionally on a solid background
+    padded by (x, y) pixels in total, like Rect.inflate."""
+
+    def __init__(
+        self,
+        text: str,
+        size: int,
+        color: Tuple[int, ...],
+        background: Optional[Tuple[int, ...]] = None,
+        padding: Tuple[int, int] = (0, 0),
+        **anchor,
+    ) -> None:
+        super().__init__(**anchor)
+        self.text = text
+        self.size = size
+        self.color = color
+        self.background = background
+        self.padding = padding
+
+    def render(self) -> pygame.Surface:
+        text = render_text(self.text, self.size, self.color)
+        if self.background is None:
+            return text
+        px, py = self.padding
+        w, h = text.get_size()
+        surface = pygame.Surface((w + px, h + py))
+        surface.fill(self.background)
+        surface.blit(text, (px // 2, py // 2))
+        return surface
+
+
+class Sprite(Widget):
+    """An image, scaled once to size if given"""
+
+    def __init__(
+        self,
+        image: pygame.Surface,
+        size: Optional[Tuple[int, int]] = None,
+        **anchor,
+    ) -> None:
+        super().__init__(**anchor)
+        self.image = image
+        self.size = size
+
+    def render(self) -> pygame.Surface:
+        if self.size is None:
+            return self.image
+        return scaled(self.image, self.size)
+
+
+class Button(Widget):
+    """Content centered in a box of size that, while selected (hovered or
+    focused), is outlined with a marker pointing down at it from above.
+    Only re-rendered when the selection changes."""
+
+    BORDER = 3
+    MARKER = 15  # height of the marker, its width is 4/3 of that
+
+    def __init__(
+        self,
+        content: Widget,
+        size: Tuple[int, int],
+        color: Tuple[int, ...] = (255, 255, 0),
+        selected: bool = False,
+        center: Tuple[int, int] = (0, 0),
+    ) -> None:
+        # the surface spans the marker too, placed so the box is centered
+        w, h = size
+        cx, cy = center
+        super().__init__(topleft=(cx - w // 2, cy - h // 2 - self.MARKER))
+        self.content = content
+        self.size = size
+        self.color = color
+        self.selected = selected
+
+    def set_selected(self, selected: bool) -> None:
+        if selected != self.selected:
+            self.selected = selected
+            self.invalidate()
+
+    def render(self) -> pygame.Surface:
+        w, h = self.size
+        surface = pygame.Surface((w, h + self.MARKER), pygame.SRCALPHA)
+        box = pygame.Rect(0, self.MARKER, w, h)
+        if self.selected:
+            pygame.draw.rect(surface, self.color, box, self.BORDER)
+            half = self.MARKER * 2 // 3
+            pygame.draw.polygon(
+                surface,
+                self.color,
+                [(w // 2 - half, 0), (w // 2 + half, 0), (w // 2, self.MARKER)],
+            )
+        content = self.content.surface
+        surface.blit(content, content.get_rect(center=box.center))
+        return surface
@@ -1,5 +1,8 @@
 import asyncio
+import os
 import sys
+import time
+from typing import Optional
 
 import pygame
 from pygame.locals import K_ESCAPE, K_SPACE, K_UP, KEYDOWN, QUIT
@@ -16,13 +19,39 @@ from .entities import (
     WelcomeMessage,
     VideoPlayer,
 )
-from .utils import GameConfig, Images, Sounds, Window
+from .utils import DirtyRects, GameConfig, Images, Replay, Sounds, Window
+
+
+def autopilot(game: "Flappy") -> bool:
+    """simple bot used by headless runs: flaps when the bird sinks below
+    the gap of the next pipe"""
+    player = game.player
+    for pipe in game.pipes.lower:
+        if pipe.x + pipe.w > player.x:
+            return player.y + player.h > pipe.y - 20 and player.vel_y >= 0
+    return player.y > game.floor.y * 0.5 and player.vel_y >= 0
 
 
 class Flappy:
-    def __init__(self):
+    def __init__(
+        self,
+        headless: bool = False,
+        seed: Optional[int] = None,
+        record: Optional[str] = None,
+        dirty_rects: bool = False,
+    ):
+        # path the replay of the latest game is written to
+        self.record_path = record
+        self.replay = None
+        if headless:
+            # Surface.convert and mixer.Sound still need SDL backends, the
+            # dummy drivers provide them without opening a window
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
         pygame.init()
-        pygame.display.set_caption("Flappy Bird - Dark Web Edition")
+        if not headless:
+            pygame.display.set_caption("Flappy Bird - Dark Web Edition")
         window = Window(288, 512)
         screen = pygame.display.set_mode((window.width, window.height))
         
@@ -35,11 +64,17 @@ class Flappy:
         self.config = GameConfig(
             screen=screen,
             clock=pygame.time.Clock(),
-            fps=30,
+            fps=60,  # render rate, the simulation steps at step_fps
             window=window,
             images=None,  # Will be set after bird selection
             sounds=Sounds(),
+            seed=seed,
         )
+        # redraw and present only what changes each frame, which matters
+        # most where filling and presenting the screen is slow (the web).
+        # the debug overlay draws outside entity rects, so not with it
+        if (dirty_rects or self.is_web) and not self.config.debug:
+            self.config.dirty_rects = DirtyRects(screen)
 
     def detect_web_environment(self):
         """Detect if running in a web environment"""
@@ -66,24 +101,120 @@ class Flappy:
             # Stop all sounds when starting a new game
             self.config.sounds.stop_all()
             
+            # Every game gets its own seed, so it can be replayed alone
+            self.config.reseed()
+
             # Create images with selected bird
-            self.config.images = Images(self.selected_bird_index)
+            self.config.images = Images(
+                self.selected_bird_index, self.config.random
+            )
             
             self.background = Background(self.config)
-            self.floor = Floor(self.config)
-            self.player = Player(self.config)
+            if self.config.dirty_rects is not None:
+                self.config.dirty_rects.set_background(self.background.image)
             self.welcome_message = WelcomeMessage(self.config)
             self.game_over_message = EnhancedGameOver(self.config)
-            self.pipes = Pipes(self.config)
-            self.score = Score(self.config)
+            self.reset()
             await self.splash()
             await self.play()
             await self.game_over()
 
+    def reset(self) -> None:
+        """creates the entities that take part in the simulation"""
+        self.floor = Floor(self.config)
+        self.player = Player(self.config)
+        self.pipes = Pipes(self.config)
+        self.score = Score(self.config)
+
+    def step(self, flap: bool = False) -> bool:
+        """advances the game by one frame without drawing anything.
+        returns True when the player crashed."""
+        if self.player.collided(self.pipes, self.floor):
+            return True
+
+        pipe = self.pipes.next_pipe(self.player.cx)
+        if pipe and self.player.crossed(pipe):
+            self.score.add()
+
+        if flap:
+            self.player.flap()
+
+        self.floor.update()
+        self.pipes.update()
+        self.score.update()
+        self.player.update()
+        return False
+
+    def new_episode(self, seed: Optional[int] = None) -> None:
+        """starts a game straight in play mode, for headless stepping.
+        images are picked from the game's RNG as in start(), so a seed
+        gives the same course here as in a game or its replay."""
+        self.config.reseed(seed)
+        self.config.images = Images(
+            self.selected_bird_index or 0, self.config.random
+        )
+        self.reset()
+        self.player.set_mode(PlayerMode.NORMAL)
+
+    def simulate(self, episodes: int = 1, policy=autopilot, max_frames=None):
+        """runs episodes headless, as fast as possible, and returns stats"""
+        scores = []
+        frames = 0
+        start = time.perf_counter()
+        for _ in range(episodes):
+            self.new_episode()
+            episode_frames = 0
+            while not self.step(policy(self)):
+                episode_frames += 1
+                if max_frames and episode_frames >= max_frames:
+                    break
+            frames += episode_frames
+            scores.append(self.score.score)
+        elapsed = time.perf_counter() - start
+
+        return {
+            "episodes": episodes,
+            "frames": frames,
+            "seconds": elapsed,
+            "fps": frames / elapsed if elapsed else 0.0,
+            "scores": scores,
+        }
+
+    def play_replay(self, replay: Replay) -> dict:
+        """re-runs a recorded game without drawing, as fast as the
+        simulation allows, and returns stats"""
+        start = time.perf_counter()
+        self.config.reseed(replay.seed)
+        self.config.images = Images(replay.bird, self.config.random)
+        self.reset()
+
+        self.player.set_mode(PlayerMode.SHM)
+        for _ in range(replay.splash_steps):
+            self.floor.update()
+            self.player.update()
+
+        self.score.reset()
+        self.player.set_mode(PlayerMode.NORMAL)
+        taps = set(replay.taps)
+        frame = 0
+        while not self.step(frame in taps):
+            frame += 1
+        elapsed = time.perf_counter() - start
+
+        return {
+            "frames": frame,
+            "score": self.score.score,
+            "matches": frame == replay.frames,
+            "seconds": elapsed,
+            "fps": frame / elapsed if elapsed else 0.0,
+        }
+
     async def splash(self):
         """Shows welcome splash screen animation of flappy bird"""
 
         self.player.set_mode(PlayerMode.SHM)
+        self.replay = Replay(self.config.game_seed, self.selected_bird_index)
+        self.config.reset_timing()
 
         while True:
             for event in pygame.event.get():
@@ -91,15 +222,40 @@ class Flappy:
                 if self.is_tap_event(event):
                     return
 
-            self.background.tick()
-            self.floor.tick()
-            self.player.tick()
-            self.welcome_message.tick()
+            for _ in self.config.timestep.steps():
+                self.floor.update()
+                self.player.update()
+                self.replay.splash_steps += 1
 
-            pygame.display.update()
+            self.clear()
+            self.floor.render()
+            self.player.render()
+            self.welcome_message.render()
+
+            self.present()
             await asyncio.sleep(0)
             self.config.tick()
 
+    def clear(self) -> None:
+        """starts a frame by drawing the background, or in dirty-rect mode
+        by restoring it where the last frame drew"""
+        if self.config.dirty_rects is not None:
+            self.config.dirty_rects.begin()
+        else:
+            self.background.render()
+
+    def present(self, full: bool = False) -> None:
+        """draws the debug overlay, if on, and shows the frame. full
+        pushes the whole screen, for frames drawn outside of entities"""
+        if self.config.debug_overlay is not None:
+            self.config.debug_overlay.flush(self.config.screen)
+        if self.config.dirty_rects is not None and not full:
+            self.config.dirty_rects.present()
+        else:
+            pygame.display.update()
+            if self.config.dirty_rects is not None:
+                self.config.dirty_rects.invalidate()
+
     def check_quit_event(self, event):
         if event.type == QUIT or (
             event.type == KEYDOWN and event.key == K_ESCAPE
@@ -119,29 +275,41 @@ class Flappy:
         self.score.reset()
         self.player.set_mode(PlayerMode.NORMAL)
 
+        # a tap is kept until the next simulation step, which may be a few
+        # rendered frames away when rendering faster than step_fps
+        flap = False
+        frame = 0
+        self.config.reset_timing()
         while True:
-            if self.player.collided(self.pipes, self.floor):
-                return
-
-            for i, pipe in enumerate(self.pipes.upper):
-                if self.player.crossed(pipe):
-                    self.score.add()
-
             for event in pygame.event.get():
                 self.check_quit_event(event)
                 if self.is_tap_event(event):
-                    self.player.flap()
+                    flap = True
 
-            self.background.tick()
-            self.floor.tick()
-            self.pipes.tick()
-            self.score.tick()
-            self.player.tick()
+            for _ in self.config.timestep.steps():
+                if flap:
+                    self.replay.tap(frame)
+                if self.step(flap):
+                    self.save_replay(frame)
+                    return
+                flap = False
+                frame += 1
 
-            pygame.display.update()
+            self.clear()
+            self.floor.render()
+            self.pipes.render()
+            self.score.render()
+            self.player.render()
+
+            self.present()
             await asyncio.sleep(0)
             self.config.tick()
 
+    def save_replay(self, frames: int) -> None:
+        self.replay.frames = frames
+        if self.record_path:
+            self.replay.save(self.record_path)
+
     async def game_over(self):
         """crashes the player down and shows gameover image"""
 
@@ -153,6 +321,7 @@ class Flappy:
         death_sound_finished = False
         player_hit_ground = False
         game_over_start_time = pygame.time.get_ticks()
+        self.config.reset_timing()
         
         while True:
             current_time = pygame.time.get_ticks()
@@ -167,15 +336,22 @@ class Flappy:
                         self.config.sounds.stop_all()
                         return
 
-            self.background.tick()
-            self.floor.tick()
-            self.pipes.tick()
-            self.score.tick()
-            self.player.tick()
-            
-            # Check if player hit the ground
-            if self.player.y + self.player.h >= self.floor.y - 1:
-                player_hit_ground = True
+            for _ in self.config.timestep.steps():
+                self.floor.update()
+                self.pipes.update()
+                self.player.update()
+                if player_hit_ground:
+                    self.game_over_message.update()
+
+                # Check if player hit the ground
+                if self.player.y + self.player.h >= self.floor.y - 1:
+                    player_hit_ground = True
+
+            self.clear()
+            self.floor.render()
+            self.pipes.render()
+            self.score.render()
+            self.player.render()
             
             # Check if death sound finished playing (or timeout after 3 seconds)
             if not self.config.sounds.is_death_sound_playing() or current_time - game_over_start_time > 3000:
@@ -183,10 +359,10 @@ class Flappy:
             
             # Show game over message immediately when player hits ground
             if player_hit_ground:
-                self.game_over_message.tick()
+                self.game_over_message.render()
 
             self.config.tick()
-            pygame.display.update()
+            self.present()
             await asyncio.sleep(0)
 
         # Stop any remaining sounds before restarting
@@ -251,9 +427,9 @@ class Flappy:
             
             # Clear screen and draw video
             self.config.screen.fill((0, 0, 0))
-            video_player.tick()
-            video_player.draw(self.config.screen)
+            video_player.update()
+            video_player.render()
             
-            pygame.display.update()
+            self.present(full=True)
             await asyncio.sleep(0)
             self.config.tick()
@@ -0,0 +1,11 @@
+from .batch import BirdBatch
+from .env import FlappyEnv
+from .pixels import FrameStack
+from .rollout import RolloutRunner
+
+__all__ = [
+    "BirdBatch",
+    "FlappyEnv",
+    "FrameStack",
+    "RolloutRunner",
+]
@@ -0,0 +1,188 @@
+from itertools import cycle
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from ..entities import Entity, Floor, Pipes, Player
+from ..utils import GameConfig, RotationAtlas
+from ..utils.rotation import ROT_MIN
+
+FLAP_ROT = 80  # rotation set on flap, see Player.flap
+
+
+def mask_array(hit_mask: pygame.mask.Mask) -> np.ndarray:
+    """converts a hit mask into a (w, h) boolean array"""
+    surface = hit_mask.to_surface(
+        setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0)
+    )
+    return pygame.surfarray.array_alpha(surface) > 0
+
+
+def stack_rotated(rotated: RotationAtlas) -> Tuple[np.ndarray, np.ndarray]:
+    """every angle's mask in one (angles, w, h) array, sized to the largest
+    and padded with empty pixels, plus an (angles, 4) array of each
+    angle's offset and real size"""
+    arrays = [mask_array(mask) for mask in rotated.masks]
+    w = max(a.shape[0] for a in arrays)
+    h = max(a.shape[1] for a in arrays)
+    stacked = np.zeros((len(arrays), w, h), dtype=bool)
+    for i, a in enumerate(arrays):
+        stacked[i, : a.shape[0], : a.shape[1]] = a
+    rects = [(*offset, *a.shape) for offset, a in zip(rotated.offsets, arrays)]
+    return stacked, np.array(rects)
+
+
+class BirdBatch:
+    """N birds flying the same pipe course, stepped as NumPy arrays.
+
+    Every bird follows the rules of a Player in PlayerMode.NORMAL. The
+    physics constants are read from a template Player, so tuning
+    Player.reset_vals_normal changes the batch too. Collision uses the
+    template's rotated masks, picked per bird by its rotation.
+    """
+
+    def __init__(self, config: GameConfig, n: int) -> None:
+        self.config = config
+        self.n = n
+
+        template = Player(config)
+        template.reset_vals_normal()
+        self.template = template
+        self.start_y = template.y
+        self.min_y = template.min_y
+        self.max_y = template.max_y
+        self.max_vel_y = template.max_vel_y
+        self.acc_y = template.acc_y
+        self.flap_acc = template.flap_acc
+        self.vel_rot = template.vel_rot
+        self.rot_min = template.rot_min
+        self.rot_max = template.rot_max
+
+        self.rotation_step = template.rotations[0].step
+        self.masks, self.rects = zip(
+            *(stack_rotated(rotated) for rotated in template.rotations)
+        )
+        self._padded: Dict[Tuple[pygame.mask.Mask, int, int], np.ndarray] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """puts every bird back at the start of a fresh pipe course"""
+        n = self.n
+        self.y = np.full(n, float(self.start_y))
+        self.vel_y = np.full(n, float(self.template.vel_y))
+        self.rot = np.full(n, float(self.template.rot))
+        self.flapped = np.zeros(n, dtype=bool)
+        self.alive = np.ones(n, dtype=bool)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.frames = np.zeros(n, dtype=np.int32)
+
+        self.frame = 0
+        self.img_idx = 0
+        self.img_gen = cycle([0, 1, 2, 1])
+        self.pipes = Pipes(self.config)
+        self.floor = Floor(self.config)
+
+    @property
+    def done(self) -> bool:
+        return not self.alive.any()
+
+    def step(self, flaps: Optional[np.ndarray] = None) -> np.ndarray:
+        """advances every living bird by one frame, in the same order as
+        Flappy.step. returns the alive flags."""
+        self.alive &= ~self.collided()
+
+        pipe = self.pipes.next_pipe(self.template.cx)
+        if pipe and self.template.crossed(pipe):
+            self.score[self.alive] += 1
+
+        alive = self.alive
+        if flaps is not None:
+            flap = np.asarray(flaps, dtype=bool) & alive & (self.y > self.min_y)
+            self.vel_y[flap] = self.flap_acc
+            self.flapped |= flap
+            self.rot[flap] = FLAP_ROT
+
+        accelerate = alive & (self.vel_y < self.max_vel_y) & ~self.flapped
+        self.vel_y += np.where(accelerate, self.acc_y, 0)
+        self.flapped.fill(False)
+
+        moved = np.clip(self.y + self.vel_y, self.min_y, self.max_y)
+        self.y = np.where(alive, moved, self.y)
+        rotated = np.clip(self.rot + self.vel_rot, self.rot_min, self.rot_max)
+        self.rot = np.where(alive, rotated, self.rot)
+        self.frames += alive
+
+        self.update_image()
+        self.floor.update()
+        self.pipes.update()
+        return self.alive
+
+    def update_image(self) -> None:
+        # all birds share one wing animation, as they were all created at once
+        self.frame += 1
+        if self.frame % 5 == 0:
+            self.img_idx = next(self.img_gen)
+
+    def collided(self) -> np.ndarray:
+        """returns a flag per bird, True if it overlaps the floor or a pipe"""
+        masks = self.masks[self.img_idx]
+        angles = np.rint((self.rot - ROT_MIN) / self.rotation_step)
+        angles = np.clip(angles, 0, len(masks) - 1).astype(np.intp)
+        # rotated rect of every bird; pygame.Rect truncates towards zero
+        x, y, w, h = self.rects[self.img_idx][angles].T
+        x = x + self.template.rect.x
+        y = y + np.trunc(self.y).astype(np.intp)
+        rects = (x, y, w, h)
+
+        hit = self.overlaps(self.floor, masks, angles, rects)
+        x0, x1 = x.min(), (x + w).max()
+        for up_pipe, low_pipe in self.pipes.near(x0, x1):
+            hit |= self.overlaps(up_pipe, masks, angles, rects)
+            hit |= self.overlaps(low_pipe, masks, angles, rects)
+        return hit
+
+    def overlaps(
+        self,
+        entity: Entity,
+        masks: np.ndarray,
+        angles: np.ndarray,
+        rects: Tuple[np.ndarray, ...],
+    ) -> np.ndarray:
+        """pixel collision of every bird against one entity at once; rects
+        are the x, y, w, h of each bird's rotated mask"""
+        hit = np.zeros(self.n, dtype=bool)
+        _, bw, bh = masks.shape
+        x, y, w, h = rects
+        rect = entity.rect
+        dx = x - rect.x
+        dy = y - rect.y
+        candidates = np.flatnonzero(
+            self.alive
+            & (-w < dx)
+            & (dx < rect.w)
+            & (-h < dy)
+            & (dy < rect.h)
+        )
+        if not len(candidates):
+            return hit
+
+        padded = self.padded_mask(entity, bw, bh)
+        cols = np.arange(bw)[None, :, None] + bw + dx[candidates, None, None]
+        rows = np.arange(bh)[None, None, :] + bh + dy[candidates, None, None]
+        windows = padded[cols, rows]
+        bird_masks = masks[angles[candidates]]
+        hit[candidates] = (windows & bird_masks).any(axis=(1, 2))
+        return hit
+
+    def padded_mask(self, entity: Entity, bw: int, bh: int) -> np.ndarray:
+        """entity's mask with a bird-sized empty margin, so bird windows can
+        be gathered without clipping"""
+        key = (entity.hit_mask, bw, bh)
+        if key not in self._padded:
+            mask = mask_array(entity.hit_mask)
+            w, h = mask.shape
+            padded = np.zeros((w + 2 * bw, h + 2 * bh), dtype=bool)
+            padded[bw : bw + w, bh : bh + h] = mask
+            self._padded[key] = padded
+        return self._padded[key]
@@ -0,0 +1,128 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pygame
+
+from ..entities import Background
+from ..flappy import Flappy
+from .pixels import FrameStack
+
+OBS_SIZE = 7
+ALIVE_REWARD = 0.1
+PIPE_REWARD = 1.0
+CRASH_REWARD = -1.0
+
+
+def observe(game: Flappy, out: np.ndarray) -> None:
+    """writes the state vector of a game into out: bird y, velocity and
+    rotation, then x distance and gap center y of the next two pipes"""
+    player = game.player
+    pipes = game.pipes
+    out[0] = player.y
+    out[1] = player.vel_y
+    out[2] = player.rot
+
+    i = 3
+    for lower in pipes.lower:
+        if i == OBS_SIZE:
+            break
+        if lower.x + lower.w <= player.x:
+            continue  # already passed
+        out[i] = lower.x - player.x
+        out[i + 1] = lower.y - pipes.pipe_gap / 2
+        i += 2
+    while i < OBS_SIZE:
+        out[i] = game.config.window.width
+        out[i + 1] = game.config.window.viewport_height / 2
+        i += 2
+
+
+class FlappyEnv:
+    """Gym-style environment over the game entities.
+
+    step() runs Flappy.step, so collisions and scoring are exactly the
+    game's own Player.collided and Player.crossed, and nothing is drawn
+    unless render() is called. Action 1 flaps, 0 doesn't.
+
+    Observations are written into one array, out if given (e.g. a row of
+    a shared buffer), and that same array is returned by reset() and
+    step(); copy it to keep an observation past the next step.
+
+    With pixels=True the observation is instead the last frame_stack
+    screens, each drawn off-screen and read through a FrameStack.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        render: bool = False,
+        out: Optional[np.ndarray] = None,
+        pixels: bool = False,
+        frame_stack: int = 4,
+        downsample: int = 2,
+        grayscale: bool = True,
+    ) -> None:
+        self.game = Flappy(headless=not render, seed=seed)
+        # steps are driven here, draw the latest one as is
+        self.game.config.timestep.interpolate = False
+        self.obs = np.zeros(OBS_SIZE, np.float32) if out is None else out
+        self.background = None
+        self.frames = None
+        if pixels:
+            self.frames = FrameStack(
+                self.game.config.screen, frame_stack, downsample, grayscale
+            )
+        self.score = 0
+        self.steps = 0
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """starts a new episode, seeded with seed or from the session"""
+        self.game.new_episode(seed)
+        # each episode has its own background, picked by its seed
+        self.background = None
+        self.score = 0
+        self.steps = 0
+        observe(self.game, self.obs)
+        if self.frames is not None:
+            self.draw()
+            self.frames.reset()
+            return self.frames.stack()
+        return self.obs
+
+    def step(self, action) -> Tuple[np.ndarray, float, bool, dict]:
+        crashed = self.game.step(bool(action))
+        crossed = self.game.score.score - self.score
+        self.score = self.game.score.score
+        if crashed:
+            reward = CRASH_REWARD
+        else:
+            reward = ALIVE_REWARD + PIPE_REWARD * crossed
+            self.steps += 1
+            observe(self.game, self.obs)
+        info = {"score": self.score, "frames": self.steps}
+        if self.frames is not None:
+            if not crashed:
+                self.draw()
+                self.frames.capture()
+            return self.frames.stack(), reward, crashed, info
+        return self.obs, reward, crashed, info
+
+    def render(self) -> None:
+        self.draw()
+        pygame.display.update()
+
+    def draw(self) -> None:
+        """draws the game to config.screen without presenting it"""
+        game = self.game
+        if self.background is None:
+            self.background = Background(game.config)
+        self.background.render()
+        game.floor.render()
+        game.pipes.render()
+        game.score.render()
+        game.player.render()
+        if game.config.debug_overlay is not None:
+            game.config.debug_overlay.flush(game.config.screen)
+
+    def close(self) -> None:
+        pygame.quit()
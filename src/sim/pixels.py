@@ -0,0 +1,82 @@
+import numpy as np
+import pygame
+
+# ITU-R 601 luma weights, scaled to sum to 256
+LUMA = (77, 150, 29)
+
+
+class FrameStack:
+    """The last k frames of a surface, downsampled and optionally grayscale.
+
+    Each capture wraps the surface's pixels in a pixels3d view (no copy of
+    the pixel data, it only locks the surface until the view is dropped),
+    downsamples by striding that view and converts straight into the next
+    slot of a preallocated ring buffer. stack() returns the frames oldest
+    first, gathered into another preallocated array, so nothing of frame
+    size is allocated per step.
+    """
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        k: int = 4,
+        downsample: int = 2,
+        grayscale: bool = True,
+    ) -> None:
+        self.surface = surface
+        self.k = k
+        self.downsample = downsample
+        self.grayscale = grayscale
+
+        w, h = surface.get_size()
+        # frames are stored row-major, (h, w), unlike surfarray's (w, h)
+        size = (len(range(0, h, downsample)), len(range(0, w, downsample)))
+        shape = size if grayscale else (*size, 3)
+        self.frames = np.zeros((k, *shape), dtype=np.uint8)
+        self.stacked = np.zeros_like(self.frames)
+        self.luma = np.zeros(size, dtype=np.uint16)
+        self.channel = np.zeros(size, dtype=np.uint16)
+        # gather order for every ring position, oldest frame first
+        self.orders = [np.roll(np.arange(k), -(i + 1)) for i in range(k)]
+        self.index = k - 1
+
+    @property
+    def shape(self):
+        return self.frames.shape
+
+    def capture(self) -> None:
+        """adds the surface's current pixels as the newest frame"""
+        self.index = (self.index + 1) % self.k
+        self.convert(self.frames[self.index])
+
+    def reset(self) -> None:
+        """fills every slot with the current frame, for a new episode"""
+        self.capture()
+        self.frames[:] = self.frames[self.index]
+
+    def stack(self) -> np.ndarray:
+        # mode="raise" (the default) always buffers out, clip writes directly
+        np.take(
+            self.frames,
+            self.orders[self.index],
+            axis=0,
+            out=self.stacked,
+            mode="clip",
+        )
+        return self.stacked
+
+    def convert(self, out: np.ndarray) -> None:
+        view = pygame.surfarray.pixels3d(self.surface)
+        step = self.downsample
+        pixels = view[::step, ::step].transpose(1, 0, 2)
+        if not self.grayscale:
+            np.copyto(out, pixels)
+        else:
+            np.multiply(pixels[..., 0], LUMA[0], out=self.luma, dtype=np.uint16)
+            for c in (1, 2):
+                np.multiply(
+                    pixels[..., c], LUMA[c], out=self.channel, dtype=np.uint16
+                )
+                self.luma += self.channel
+            np.right_shift(self.luma, 8, out=out, casting="unsafe")
+        del pixels, view  # unlocks the surface
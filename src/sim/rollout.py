@@ -0,0 +1,175 @@
+import multiprocessing as mp
+import os
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .env import OBS_SIZE, FlappyEnv
+
+# commands sent to workers, one byte each
+RESET = b"r"
+STEP = b"s"
+CLOSE = b"c"
+# seconds a worker gets to exit after CLOSE before it's terminated
+CLOSE_TIMEOUT = 5.0
+
+
+class SharedArrays:
+    """numpy arrays for obs, rewards, dones and actions of every env, each
+    backed by a shared memory block that workers attach to by name"""
+
+    SPECS = {
+        "obs": (np.float32, (OBS_SIZE,)),
+        "rewards": (np.float32, ()),
+        "dones": (np.bool_, ()),
+        "actions": (np.int8, ()),
+    }
+
+    def __init__(self, num_envs: int, names: Optional[dict] = None) -> None:
+        self.blocks: List[shared_memory.SharedMemory] = []
+        self.owner = names is None
+        self.names = {}
+        for field, (dtype, shape) in self.SPECS.items():
+            shape = (num_envs, *shape)
+            if self.owner:
+                size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+                block = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                block = shared_memory.SharedMemory(name=names[field])
+            self.blocks.append(block)
+            self.names[field] = block.name
+            setattr(self, field, np.ndarray(shape, dtype, buffer=block.buf))
+
+    def close(self) -> None:
+        for field in self.SPECS:
+            setattr(self, field, None)  # drop views before closing buffers
+        for block in self.blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass  # a caller still holds a view, freed along with it
+            if self.owner:
+                block.unlink()
+        self.blocks = []
+
+
+def worker(conn, names: dict, num_envs: int, start: int, stop: int, seed: int):
+    """runs envs start..stop, reading actions from and writing results to
+    the shared arrays whenever the parent sends a command"""
+    arrays = SharedArrays(num_envs, names)
+    envs = [
+        FlappyEnv(seed=seed + i, out=arrays.obs[i]) for i in range(start, stop)
+    ]
+
+    try:
+        while True:
+            command = conn.recv_bytes()
+            if command == CLOSE:
+                break
+            if command == RESET:
+                for idx, env in enumerate(envs, start):
+                    env.reset()
+                    arrays.rewards[idx] = 0
+                    arrays.dones[idx] = False
+            elif command == STEP:
+                for idx, env in enumerate(envs, start):
+                    _, reward, done, _ = env.step(arrays.actions[idx])
+                    if done:
+                        env.reset()
+                    arrays.rewards[idx] = reward
+                    arrays.dones[idx] = done
+            conn.send_bytes(command)
+    finally:
+        envs = None  # drop views on the obs block before closing it
+        arrays.close()
+
+
+class RolloutRunner:
+    """Steps num_envs independent, seeded headless games across a pool of
+    worker processes.
+
+    Observations, rewards, done flags and actions live in shared memory;
+    a step only sends one byte to each worker and waits for one back, so
+    nothing is pickled per step. Envs are split into contiguous slices,
+    one per worker. A crashed game is reset right away: its done flag is
+    set and its row of obs already holds the next episode's first state.
+    """
+
+    def __init__(
+        self,
+        num_envs: int = 64,
+        num_workers: Optional[int] = None,
+        seed: int = 0,
+    ) -> None:
+        self.num_envs = num_envs
+        num_workers = min(num_workers or os.cpu_count() or 1, num_envs)
+        self.arrays = SharedArrays(num_envs)
+
+        # spawn rather than fork, so workers don't inherit SDL state
+        ctx = mp.get_context("spawn")
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        self.conns = []
+        self.processes = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            parent, child = ctx.Pipe()
+            process = ctx.Process(
+                target=worker,
+                args=(
+                    child,
+                    self.arrays.names,
+                    num_envs,
+                    int(start),
+                    int(stop),
+                    seed,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self.conns.append(parent)
+            self.processes.append(process)
+
+    def broadcast(self, command: bytes) -> None:
+        for conn in self.conns:
+            conn.send_bytes(command)
+        for conn in self.conns:
+            conn.recv_bytes()
+
+    def reset(self) -> np.ndarray:
+        self.broadcast(RESET)
+        return self.arrays.obs
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """flaps the envs whose action is non-zero and steps all of them.
+        the returned arrays are views into shared memory, overwritten by
+        the next step."""
+        self.arrays.actions[:] = actions
+        self.broadcast(STEP)
+        return self.arrays.obs, self.arrays.rewards, self.arrays.dones
+
+    def close(self) -> None:
+        if not self.processes:
+            return
+        try:
+            for conn in self.conns:
+                try:
+                    conn.send_bytes(CLOSE)
+                except OSError:
+                    pass  # the worker is already gone
+            for process in self.processes:
+                process.join(CLOSE_TIMEOUT)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+        finally:
+            for conn in self.conns:
+                conn.close()
+            self.conns = []
+            self.processes = []
+            self.arrays.close()
+
+    def __enter__(self) -> "RolloutRunner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,7 +1,24 @@
+from .asset_store import AssetStore, assets
+from .cache import (
+    LRUCache,
+    asset_cache,
+    asset_cached,
+    asset_key,
+    load_image,
+    scaled,
+    tag_asset,
+    transformed,
+)
+from .debug_overlay import DebugOverlay
+from .dirty_rects import DirtyRects
+from .fonts import get_font, render_text
 from .game_config import GameConfig
 from .images import Images
+from .replay import Replay
+from .rotation import RotationAtlas, get_rotation_atlas
 from .sounds import Sounds
-from .utils import clamp, get_hit_mask, pixel_collision
+from .timestep import FixedTimestep
+from .utils import HitMaskType, clamp, get_hit_mask, pixel_collision
 from .window import Window
 from .constants import PLAYERS, BACKGROUNDS, PIPES
 from .dark_theme import DarkTheme
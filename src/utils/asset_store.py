@@ -0,0 +1,101 @@
+import json
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame
+
+from .cache import load_image, tag_asset, transformed
+
+# written by pack_sprites.py
+ATLAS_INDEX = "assets/sprites/atlas.json"
+
+
+class AssetStore:
+    """Every image the game uses, decoded and converted once for the life
+    of the process and shared by every Images built after that.
+
+    Sprites packed by pack_sprites.py are subsurfaces of the one atlas
+    image, so they all come from a single read and decode; anything not
+    in the atlas (or everything, without one) is loaded from its own
+    file.
+
+    Surfaces handed out are shared, so they must not be drawn on or
+    otherwise changed in place; derive a new surface instead.
+    """
+
+    def __init__(self, atlas_index: str = ATLAS_INDEX) -> None:
+        self.atlas_index = atlas_index
+        self.atlas: Optional[pygame.Surface] = None
+        # sprite path -> its rect in the atlas, None until first needed
+        self.regions: Optional[Dict[str, pygame.Rect]] = None
+        self.surfaces: Dict[Tuple[Hashable, ...], pygame.Surface] = {}
+        # files actually read from disk, for checking restarts don't
+        self.decoded = 0
+
+    def image(self, path: str, alpha: bool = True) -> pygame.Surface:
+        key = (path, alpha)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.from_atlas(path, alpha)
+            if surface is None:
+                surface = load_image(path, alpha)
+                self.decoded += 1
+            self.surfaces[key] = surface
+        return surface
+
+    def from_atlas(self, path: str, alpha: bool) -> Optional[pygame.Surface]:
+        if self.regions is None:
+            self.load_atlas()
+        rect = self.regions.get(path)
+        if rect is None:
+            return None
+        region = self.atlas.subsurface(rect)
+        if alpha:
+            return tag_asset(region, path, "convert_alpha")
+        return tag_asset(region.convert(), path, "convert")
+
+    def load_atlas(self) -> None:
+        self.regions = {}
+        try:
+            with open(self.atlas_index) as f:
+                index = json.load(f)
+            atlas = pygame.image.load(index["image"]).convert_alpha()
+        except FileNotFoundError:
+            return  # not packed, sprites load one by one
+        except (OSError, ValueError, KeyError, pygame.error) as e:
+            print(f"Warning: Could not load sprite atlas: {e}")
+            return
+        self.decoded += 1
+        self.atlas = atlas
+        self.regions = {
+            path: pygame.Rect(rect) for path, rect in index["sprites"].items()
+        }
+
+    def derived(
+        self,
+        path: str,
+        transform: Tuple[Hashable, ...],
+        make: Callable[[pygame.Surface], pygame.Surface],
+        alpha: bool = True,
+    ) -> pygame.Surface:
+        """make(image) for the image at path, made once and tagged as that
+        asset with transform applied"""
+        key = (path, alpha, transform)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            image = self.image(path, alpha)
+            surface = transformed(image, make(image), transform)
+            self.surfaces[key] = surface
+        return surface
+
+    def flipped(
+        self, path: str, x: bool, y: bool, alpha: bool = True
+    ) -> pygame.Surface:
+        return self.derived(
+            path,
+            ("flip", x, y),
+            lambda image: pygame.transform.flip(image, x, y),
+            alpha,
+        )
+
+
+assets = AssetStore()
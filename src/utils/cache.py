@@ -0,0 +1,120 @@
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import pygame
+
+ASSET_CACHE_SIZE = 128
+
+# surface -> asset key, for surfaces loaded (and transformed) from files
+_asset_keys: "weakref.WeakKeyDictionary[pygame.Surface, tuple]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry once it
+    holds maxsize, counting hits, misses and evictions."""
+
+    def __init__(self, maxsize: int = ASSET_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """the value cached for key, made with factory() on a miss"""
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            value = factory()
+            self.entries[key] = value
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+            return value
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+        }
+
+
+# values in here are shared by every caller that gets them, surfaces
+# included, so they must not be drawn on or otherwise changed in place
+asset_cache = LRUCache()
+
+
+def tag_asset(surface: pygame.Surface, *key: Hashable) -> pygame.Surface:
+    """records which file and transforms surface was made from, e.g.
+    tag_asset(image, path, "convert_alpha"), and returns it"""
+    _asset_keys[surface] = key
+    return surface
+
+
+def asset_key(surface: pygame.Surface) -> Optional[tuple]:
+    return _asset_keys.get(surface)
+
+
+def load_image(path: str, alpha: bool = True) -> pygame.Surface:
+    """loads and converts an image, tagged with its path"""
+    image = pygame.image.load(path)
+    if alpha:
+        return tag_asset(image.convert_alpha(), path, "convert_alpha")
+    return tag_asset(image.convert(), path, "convert")
+
+
+def transformed(
+    surface: pygame.Surface, result: pygame.Surface, *transform: Hashable
+) -> pygame.Surface:
+    """tags result as surface's asset with transform applied, if surface
+    is a tagged asset, and returns it"""
+    key = asset_key(surface)
+    if key is not None:
+        tag_asset(result, *key, transform)
+    return result
+
+
+def scaled(
+    surface: pygame.Surface, size: Tuple[float, float]
+) -> pygame.Surface:
+    """surface scaled to size, kept in asset_cache if surface is a tagged
+    asset"""
+
+    def scale() -> pygame.Surface:
+        return transformed(
+            surface, pygame.transform.scale(surface, size), ("scale", *size)
+        )
+
+    key = asset_key(surface)
+    if key is None:
+        return scale()
+    return asset_cache.get(("scale", key, tuple(size)), scale)
+
+
+def asset_cached(func):
+    """caches func(surface) in asset_cache under the surface's asset key,
+    so every load of the same file shares one result. surfaces that
+    aren't tagged assets are computed every time, not cached."""
+
+    @wraps(func)
+    def wrapper(surface: pygame.Surface):
+        key = asset_key(surface)
+        if key is None:
+            return func(surface)
+        return asset_cache.get((func.__name__, key), lambda: func(surface))
+
+    return wrapper
@@ -3,6 +3,8 @@ Dark Theme Configuration for Flappy Bird Web Version
 """
 import pygame
 
+from .cache import asset_cache
+
 class DarkTheme:
     """Dark theme colors and styling for the web version"""
     
@@ -34,25 +36,28 @@ class DarkTheme:
     
     @classmethod
     def create_gradient_surface(cls, width, height, color1, color2, vertical=True):
-        """Create a gradient surface between two colors"""
-        surface = pygame.Surface((width, height))
-        
-        if vertical:
-            for y in range(height):
-                ratio = y / height
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
-        else:
-            for x in range(width):
-                ratio = x / width
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                pygame.draw.line(surface, (r, g, b), (x, 0), (x, height))
-        
-        return surface
+        """Create a gradient surface between two colors, cached by size,
+        colors and orientation in asset_cache."""
+        key = ("gradient", width, height, tuple(color1), tuple(color2), vertical)
+        return asset_cache.get(
+            key, lambda: cls.render_gradient(width, height, color1, color2, vertical)
+        )
+
+    @staticmethod
+    def render_gradient(width, height, color1, color2, vertical=True):
+        """Builds the gradient as a 1 pixel strip and stretches it, so only
+        one color per row (or column) is computed. Converted to the
+        display format, so blitting it needs no conversion."""
+        length = height if vertical else width
+        ratios = [i / length for i in range(length)]
+        strip = bytearray(length * 3)
+        for channel, (c1, c2) in enumerate(zip(color1[:3], color2[:3])):
+            strip[channel::3] = bytes(
+                [int(c1 * (1 - ratio) + c2 * ratio) for ratio in ratios]
+            )
+        size = (1, length) if vertical else (length, 1)
+        strip = pygame.image.frombuffer(bytes(strip), size, "RGB")
+        return pygame.transform.scale(strip, (width, height)).convert()
     
     @classmethod
     def draw_dark_button(cls, surface, rect, text, font, hover=False):
@@ -78,15 +83,8 @@ class DarkTheme:
     @classmethod
     def draw_dark_panel(cls, surface, rect, title=None, font=None):
         """Draw a dark themed panel"""
-        # Panel background with gradient
-        gradient = cls.create_gradient_surface(
-            rect.width, rect.height, 
-            cls.BACKGROUND_MEDIUM, cls.BACKGROUND_DARK
-        )
-        surface.blit(gradient, rect)
-        
-        # Border
-        pygame.draw.rect(surface, cls.BORDER_COLOR, rect, 2)
+        # Panel background with gradient and border, made once per size
+        surface.blit(cls.create_panel_surface(rect.width, rect.height), rect)
         
         # Title if provided
         if title and font:
@@ -94,6 +92,20 @@ class DarkTheme:
             title_rect = title_surface.get_rect(centerx=rect.centerx, y=rect.y + 10)
             surface.blit(title_surface, title_rect)
     
+    @classmethod
+    def create_panel_surface(cls, width, height):
+        """A panel's gradient background and border, cached by size in
+        asset_cache."""
+
+        def render():
+            panel = cls.render_gradient(
+                width, height, cls.BACKGROUND_MEDIUM, cls.BACKGROUND_DARK
+            )
+            pygame.draw.rect(panel, cls.BORDER_COLOR, panel.get_rect(), 2)
+            return panel
+
+        return asset_cache.get(("panel", width, height), render)
+
     @classmethod
     def apply_dark_overlay(cls, surface, alpha=128):
         """Apply a dark overlay to make backgrounds darker"""
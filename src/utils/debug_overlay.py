@@ -0,0 +1,57 @@
+from typing import Dict, List, Tuple
+
+import pygame
+
+from .fonts import get_font
+
+
+class DebugOverlay:
+    """Entity rects and positions, drawn on top of a frame in one pass.
+
+    Entity.render only queues its rect and numbers; flush() draws every
+    queued rect, then all labels with a single Surface.blits call. Labels
+    are laid out from glyphs rendered once per character, so changing
+    numbers never render new text.
+    """
+
+    COLOR = (255, 0, 0)
+    TEXT_COLOR = (255, 255, 255)
+
+    def __init__(self, font: str = "Arial", size: int = 13) -> None:
+        self.font_name = font
+        self.font_size = size
+        self.glyphs: Dict[str, pygame.Surface] = {}
+        self.rects: List[pygame.Rect] = []
+        self.labels: List[Tuple[pygame.Rect, str]] = []
+
+    def add(self, rect: pygame.Rect, x: float, y: float, w: float, h: float):
+        self.rects.append(rect)
+        self.labels.append((rect, f"{x:.1f}, {y:.1f}, {w:.1f}, {h:.1f}"))
+
+    def glyph(self, char: str) -> pygame.Surface:
+        surface = self.glyphs.get(char)
+        if surface is None:
+            font = get_font(self.font_name, self.font_size, True)
+            surface = font.render(char, True, self.TEXT_COLOR)
+            self.glyphs[char] = surface
+        return surface
+
+    def flush(self, screen: pygame.Surface) -> None:
+        """draws and clears everything queued since the last flush"""
+        for rect in self.rects:
+            pygame.draw.rect(screen, self.COLOR, rect, 1)
+
+        blits = []
+        for rect, text in self.labels:
+            glyphs = [self.glyph(char) for char in text]
+            # write x and y at top of rect
+            width = sum(glyph.get_width() for glyph in glyphs)
+            x = rect.x + rect.w / 2 - width / 2
+            y = rect.y - glyphs[0].get_height()
+            for glyph in glyphs:
+                blits.append((glyph, (x, y)))
+                x += glyph.get_width()
+        screen.blits(blits, False)
+
+        self.rects.clear()
+        self.labels.clear()
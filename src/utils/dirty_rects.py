@@ -0,0 +1,57 @@
+from typing import List, Optional
+
+import pygame
+
+
+class DirtyRects:
+    """Redraws and presents only the parts of the screen that changed.
+
+    Instead of drawing the whole background every frame, begin() restores
+    just the rects drawn over last frame from a cached background; every
+    Entity.render adds the rect it drew to, and present() flushes last
+    frame's rects and this frame's with display.update(rects), which
+    covers both where things were and where they are now. Anything drawn
+    outside an entity's reported rect would stay on screen, so the debug
+    overlay runs without it.
+    """
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        self.screen = screen
+        self.bounds = screen.get_rect()
+        self.background: Optional[pygame.Surface] = None
+        self.rects: List[pygame.Rect] = []
+        self.previous: List[pygame.Rect] = []
+        # the next frame redraws and presents the whole screen
+        self.full = True
+
+    def set_background(self, background: pygame.Surface) -> None:
+        """caches the screen-sized surface regions are restored from"""
+        self.background = background
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """makes the next frame a full redraw, e.g. after something else
+        drew to the screen"""
+        self.full = True
+
+    def add(self, rect: pygame.Rect) -> None:
+        rect = rect.clip(self.bounds)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+
+    def begin(self) -> None:
+        """restores the background under everything drawn last frame"""
+        if self.full:
+            self.screen.blit(self.background, (0, 0))
+            return
+        for rect in self.previous:
+            self.screen.blit(self.background, rect, rect)
+
+    def present(self) -> None:
+        if self.full:
+            pygame.display.update()
+            self.full = False
+        else:
+            pygame.display.update(self.previous + self.rects)
+        self.previous = self.rects
+        self.rects = []
@@ -0,0 +1,39 @@
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from .cache import asset_cache
+
+# fonts by (name, size, bold), shared by everything in the process
+_fonts: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+
+
+def get_font(
+    name: Optional[str], size: int, bold: bool = False
+) -> pygame.font.Font:
+    """a system font, or pygame's default font for name None, loaded on
+    first use only"""
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        if name is None:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+        else:
+            font = pygame.font.SysFont(name, size, bold)
+        _fonts[key] = font
+    return font
+
+
+def render_text(
+    text: str,
+    size: int,
+    color: Tuple[int, ...],
+    name: Optional[str] = None,
+    bold: bool = False,
+) -> pygame.Surface:
+    """antialiased text, rendered once and kept in asset_cache"""
+    return asset_cache.get(
+        ("text", name, size, bold, text, tuple(color)),
+        lambda: get_font(name, size, bold).render(text, True, color),
+    )
@@ -1,9 +1,14 @@
 import os
+import random
+from typing import Optional
 
 import pygame
 
+from .debug_overlay import DebugOverlay
+from .dirty_rects import DirtyRects
 from .images import Images
 from .sounds import Sounds
+from .timestep import FixedTimestep
 from .window import Window
 
 
@@ -16,6 +21,8 @@ class GameConfig:
         window: Window,
         images: Images,
         sounds: Sounds,
+        step_fps: int = 30,
+        seed: Optional[int] = None,
     ) -> None:
         self.screen = screen
         self.clock = clock
@@ -24,6 +31,34 @@ class GameConfig:
         self.images = images
         self.sounds = sounds
         self.debug = os.environ.get("DEBUG", False)
+        # entities queue their debug info here, drawn when a frame is done
+        self.debug_overlay = DebugOverlay() if self.debug else None
+        # simulation rate, independent of the render rate in fps
+        self.step_fps = step_fps
+        self.timestep = FixedTimestep(step_fps)
+        # the session RNG only hands out game seeds; everything random in a
+        # game draws from self.random, so one game replays from its seed
+        self.seed = seed
+        self.session_random = random.Random(seed)
+        self.random = random.Random()
+        self.game_seed = None
+        # set when rendering in dirty-rect mode, see DirtyRects
+        self.dirty_rects: Optional[DirtyRects] = None
+
+    def reseed(self, game_seed: Optional[int] = None) -> int:
+        """seeds the RNG for a new game, with a seed drawn from the session
+        unless one is given. returns the game's seed."""
+        if game_seed is None:
+            game_seed = self.session_random.getrandbits(32)
+        self.game_seed = game_seed
+        self.random.seed(game_seed)
+        return game_seed
 
     def tick(self) -> None:
-        self.clock.tick(self.fps)
+        self.timestep.advance(self.clock.tick(self.fps))
+
+    def reset_timing(self) -> None:
+        """starts timing afresh, so time spent outside a screen's loop
+        (loading, the previous screen's last frame) isn't caught up on"""
+        self.clock.tick()
+        self.timestep.reset()
@@ -0,0 +1,104 @@
+import struct
+from typing import List, Optional
+
+# magic, format version, game seed, bird index, splash steps, frames, taps
+HEADER = struct.Struct("<4sBIBIII")
+MAGIC = b"FLPR"
+VERSION = 1
+
+
+def encode_varint(n: int) -> bytes:
+    """LEB128: 7 bits per byte, high bit set while more bytes follow"""
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def decode_varints(data: bytes, count: int) -> List[int]:
+    values = []
+    n = shift = 0
+    for byte in data:
+        n |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            values.append(n)
+            n = shift = 0
+    if len(values) != count:
+        raise ValueError(f"replay has {len(values)} taps, expected {count}")
+    return values
+
+
+class Replay:
+    """Input recording of one game.
+
+    A game is fully determined by its seed, the bird, how many simulation
+    steps the splash screen ran (the bird bobs and the floor scrolls
+    meanwhile) and the steps of play on which the player tapped. Taps are
+    stored as varint-encoded gaps between tap frames, so a typical game
+    fits in a few hundred bytes.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        bird: int = 0,
+        splash_steps: int = 0,
+        taps: Optional[List[int]] = None,
+        frames: int = 0,
+    ) -> None:
+        self.seed = seed
+        self.bird = bird
+        self.splash_steps = splash_steps
+        self.taps = taps or []
+        # step on which the player crashed
+        self.frames = frames
+
+    def tap(self, frame: int) -> None:
+        self.taps.append(frame)
+
+    def to_bytes(self) -> bytes:
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            self.seed,
+            self.bird,
+            self.splash_steps,
+            self.frames,
+            len(self.taps),
+        )
+        body = bytearray()
+        last = 0
+        for frame in self.taps:
+            body += encode_varint(frame - last)
+            last = frame
+        return header + bytes(body)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        magic, version, seed, bird, splash_steps, frames, count = (
+            HEADER.unpack_from(data)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a flappy replay, or an unsupported version")
+
+        taps = []
+        frame = 0
+        for gap in decode_varints(data[HEADER.size :], count):
+            frame += gap
+            taps.append(frame)
+        return cls(seed, bird, splash_steps, taps, frames)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
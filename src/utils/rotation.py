@@ -0,0 +1,65 @@
+from typing import List, Tuple
+
+import pygame
+
+from .cache import asset_cached
+from .utils import HitMaskType, clamp
+
+ROT_MIN = -90  # the bird's lowest rotation, Player.rot_min
+ROT_MAX = 80  # the bird's rotation right after a flap, Player.flap
+ROT_STEP = 1  # degrees between precomputed angles
+
+
+class RotationAtlas:
+    """A sprite rotated to every ROT_STEP from ROT_MIN to ROT_MAX, with the
+    hit mask of each rotation, built once at load time so neither drawing
+    nor pixel collision has to rotate the sprite per frame.
+
+    pygame.transform.rotate grows the image to fit, and Player draws it
+    centered on its unrotated rect; offsets hold where each rotated
+    image's top left lands relative to the unrotated one.
+    """
+
+    def __init__(self, image: pygame.Surface, step: int = ROT_STEP) -> None:
+        self.step = step
+        self.images: List[pygame.Surface] = []
+        self.masks: List[HitMaskType] = []
+        self.offsets: List[Tuple[int, int]] = []
+
+        w, h = image.get_size()
+        for angle in range(ROT_MIN, ROT_MAX + 1, step):
+            rotated = pygame.transform.rotate(image, angle)
+            rw, rh = rotated.get_size()
+            self.images.append(rotated)
+            self.masks.append(pygame.mask.from_surface(rotated, 0))
+            # same rounding as Rect.center and get_rect(center=...)
+            self.offsets.append((w // 2 - rw // 2, h // 2 - rh // 2))
+
+    def index(self, angle: float) -> int:
+        """index of the precomputed angle nearest to angle"""
+        i = round((angle - ROT_MIN) / self.step)
+        return int(clamp(i, 0, len(self.masks) - 1))
+
+    def get(
+        self, angle: float, rect: pygame.Rect
+    ) -> Tuple[pygame.Rect, HitMaskType]:
+        """rect and mask of the sprite drawn rotated by angle, centered on
+        rect, the sprite's unrotated rect"""
+        i = self.index(angle)
+        mask = self.masks[i]
+        ox, oy = self.offsets[i]
+        return pygame.Rect(rect.x + ox, rect.y + oy, *mask.get_size()), mask
+
+    def get_image(
+        self, angle: float, rect: pygame.Rect
+    ) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """the sprite rotated by angle and where to blit it to center it on
+        rect"""
+        i = self.index(angle)
+        ox, oy = self.offsets[i]
+        return self.images[i], (rect.x + ox, rect.y + oy)
+
+
+@asset_cached
+def get_rotation_atlas(image: pygame.Surface) -> RotationAtlas:
+    return RotationAtlas(image)
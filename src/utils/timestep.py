@@ -0,0 +1,40 @@
+from typing import Iterator
+
+
+class FixedTimestep:
+    """Splits real frame time into fixed simulation steps.
+
+    The game loop feeds the milliseconds each rendered frame took into
+    advance() and runs one update per step yielded by steps(). Whatever
+    time is left over becomes alpha, the fraction of a step to
+    interpolate positions by when rendering.
+    """
+
+    def __init__(self, step_fps: int, max_frame_ms: float = 250) -> None:
+        self.step_fps = step_fps
+        self.step_ms = 1000 / step_fps
+        # longest frame we catch up on, so a stall doesn't fast-forward
+        self.max_frame_ms = max_frame_ms
+        self.accumulator = 0.0
+        # loops that step the simulation themselves draw the latest step
+        self.interpolate = True
+
+    @property
+    def alpha(self) -> float:
+        if not self.interpolate:
+            return 1.0
+        return min(self.accumulator / self.step_ms, 1.0)
+
+    def advance(self, elapsed_ms: float) -> None:
+        self.accumulator += min(elapsed_ms, self.max_frame_ms)
+
+    def steps(self) -> Iterator[int]:
+        """yields once for every whole step of time that has accumulated"""
+        step = 0
+        while self.accumulator >= self.step_ms:
+            self.accumulator -= self.step_ms
+            yield step
+            step += 1
+
+    def reset(self) -> None:
+        self.accumulator = 0.0
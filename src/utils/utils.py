@@ -1,9 +1,8 @@
-from functools import wraps
-from typing import List
-
 import pygame
 
-HitMaskType = List[List[bool]]
+from .cache import asset_cached
+
+HitMaskType = pygame.mask.Mask
 
 
 def clamp(n: float, minn: float, maxn: float) -> float:
@@ -11,33 +10,12 @@ def clamp(n: float, minn: float, maxn: float) -> float:
     return max(min(maxn, n), minn)
 
 
-def memoize(func):
-    cache = {}
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        key = (args, frozenset(kwargs.items()))
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
-        return cache[key]
-
-    return wrapper
-
-
-@memoize
+@asset_cached
 def get_hit_mask(image: pygame.Surface) -> HitMaskType:
-    """returns a hit mask using an image's alpha."""
-    return list(
-        (
-            list(
-                (
-                    bool(image.get_at((x, y))[3])
-                    for y in range(image.get_height())
-                )
-            )
-            for x in range(image.get_width())
-        )
-    )
+    """returns a bitmask of the pixels of an image with any alpha."""
+    # threshold 0 sets every pixel with alpha > 0; surfaces without
+    # per-pixel alpha come out fully set (or by colorkey, if they have one)
+    return pygame.mask.from_surface(image, 0)
 
 
 def pixel_collision(
@@ -52,11 +30,7 @@ def pixel_collision(
     if rect.width == 0 or rect.height == 0:
         return False
 
-    x1, y1 = rect.x - rect1.x, rect.y - rect1.y
-    x2, y2 = rect.x - rect2.x, rect.y - rect2.y
-
-    for x in range(rect.width):
-        for y in range(rect.height):
-            if hitmask1[x1 + x][y1 + y] and hitmask2[x2 + x][y2 + y]:
-                return True
-    return False
+    # the masks are tested against each other in C over the overlap, the
+    # cost no longer grows with its area in Python
+    offset = (rect2.x - rect1.x, rect2.y - rect1.y)
+    return hitmask1.overlap(hitmask2, offset) is not None
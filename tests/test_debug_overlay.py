@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from src.flappy import Flappy  # noqa: E402
+from src.utils import DebugOverlay  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def game(monkeypatch):
+    # assets are loaded by paths relative to the repository root
+    monkeypatch.chdir(ROOT)
+    game = Flappy(headless=True, seed=1)
+    game.new_episode(1)
+    game.config.debug_overlay = DebugOverlay()
+    return game
+
+
+def test_overlay_frames_score_digits(game):
+    # Score overrides rect, its w and h are 0
+    game.score.add()
+    game.score.render()
+    assert game.config.debug_overlay.rects == [game.score.rect]
+    assert game.score.rect.w > 0 and game.score.rect.h > 0
+
+
+def test_overlay_rect_follows_draw_rect(game):
+    game.player.render()
+    assert game.config.debug_overlay.rects == [game.player.draw_rect]